@@ -3,20 +3,22 @@
 Simple script to fix the commented end figure
 """
 
-# Read the file
-with open('artigo_cientifico_corrosao.tex', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+from pathlib import Path
 
-# Fix line 447 (index 446)
-if len(lines) > 446:
-    if lines[446].strip() == '% \\end{figure}':
-        lines[446] = '\\end{figure}\n'
-        print("Fixed line 447: % \\end{figure} -> \\end{figure}")
-    else:
-        print(f"Line 447 content: '{lines[446].strip()}'")
+tex_path = Path('artigo_cientifico_corrosao.tex')
 
-# Write back
-with open('artigo_cientifico_corrosao.tex', 'w', encoding='utf-8') as f:
-    f.writelines(lines)
+# Read the file
+lines = tex_path.read_text(encoding='utf-8').splitlines(keepends=True)
 
-print("File updated successfully!")
\ No newline at end of file
+# Fix line 447 (index 446); the file is only rewritten when that line changes
+if len(lines) > 446 and lines[446].strip() == '% \\end{figure}':
+    lines[446] = '\\end{figure}\n'
+    print("Fixed line 447: % \\end{figure} -> \\end{figure}")
+    
+    # Write back
+    tex_path.write_text(''.join(lines), encoding='utf-8')
+    print("File updated successfully!")
+else:
+    if len(lines) > 446:
+        print(f"Line 447 content: '{lines[446].strip()}'")
+    print("No changes needed; file left untouched.")
@@ -3,25 +3,23 @@
 Final script to fix LaTeX file
 """
 
-# Read the entire file
-with open('artigo_cientifico_corrosao.tex', 'r', encoding='utf-8') as f:
+# Read the entire file; everything below works on the raw bytes, so the
+# document is never decoded and re-encoded
+with open('artigo_cientifico_corrosao.tex', 'rb') as f:
     content = f.read()
 
 # Replace the problematic line
-content = content.replace('% \\end{figure}', '\\end{figure}')
+content = content.replace(b'% \\end{figure}', b'\\end{figure}')
 
 # Write back
-with open('artigo_cientifico_corrosao.tex', 'w', encoding='utf-8') as f:
+with open('artigo_cientifico_corrosao.tex', 'wb') as f:
     f.write(content)
 
 print("Fixed all commented \\end{figure} lines")
 
-# Verify the fix
-with open('artigo_cientifico_corrosao.tex', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-begin_count = sum(1 for line in lines if '\\begin{figure}' in line)
-end_count = sum(1 for line in lines if '\\end{figure}' in line)
+# Verify the fix on the content just written
+begin_count = content.count(b'\\begin{figure}')
+end_count = content.count(b'\\end{figure}')
 
 print(f"Begin figure count: {begin_count}")
 print(f"End figure count: {end_count}")
@@ -29,4 +27,4 @@ print(f"End figure count: {end_count}")
 if begin_count == end_count:
     print("✅ Figure environments are balanced!")
 else:
-    print("❌ Figure environments are NOT balanced!")
\ No newline at end of file
+    print("❌ Figure environments are NOT balanced!")
@@ -33,20 +33,21 @@ def load_model_and_data():
     
     return resnet50, efficientnet, splits['test']
 
-def make_gradcam_heatmap(img_array, model, last_conv_layer_name, pred_index=None):
+def make_gradcam_heatmap(img_array, model, backbone, pred_index=None):
     """Generate Grad-CAM heatmap"""
     
-    # Create a model that maps the input image to the activations
-    # of the last conv layer as well as the output predictions
-    grad_model = keras.models.Model(
-        inputs=[model.inputs],
-        outputs=[model.get_layer(last_conv_layer_name).output, model.output]
-    )
-    
-    # Compute the gradient of the top predicted class for our input image
-    # with respect to the activations of the last conv layer
+    # The backbone is nested in the model, so its feature maps are not reachable
+    # from model.inputs; run the model layer by layer and keep the backbone output
+    # (the activations of its last conv block) as the Grad-CAM target
     with tf.GradientTape() as tape:
-        last_conv_layer_output, preds = grad_model(img_array)
+        x = tf.convert_to_tensor(img_array)
+        for layer in model.layers:
+            if isinstance(layer, keras.layers.InputLayer):
+                continue
+            x = layer(x, training=False)
+            if layer is backbone:
+                last_conv_layer_output = x
+        preds = x
         if pred_index is None:
             pred_index = tf.argmax(preds[0])
         class_channel = preds[:, pred_index]
@@ -70,25 +71,13 @@ def make_gradcam_heatmap(img_array, model, last_conv_layer_name, pred_index=None
     heatmap = tf.maximum(heatmap, 0) / tf.math.reduce_max(heatmap)
     return heatmap.numpy()
 
-def get_last_conv_layer_name(model, model_name):
-    """Get the name of the last convolutional layer"""
-    if model_name == 'resnet50':
-        # For ResNet50, the last conv layer is in the base model
-        for layer in reversed(model.layers[0].layers):
-            if 'conv' in layer.name.lower():
-                return layer.name
-    elif model_name == 'efficientnet':
-        # For EfficientNet, the last conv layer is in the base model
-        for layer in reversed(model.layers[0].layers):
-            if 'conv' in layer.name.lower() or 'block' in layer.name.lower():
-                return layer.name
-    
-    # Fallback: find last Conv2D layer
-    for layer in reversed(model.layers):
-        if isinstance(layer, keras.layers.Conv2D):
-            return layer.name
-    
-    return None
+def get_backbone(model):
+    """Get the nested pretrained backbone whose output feeds the classification head"""
+    return next(
+        (layer for layer in model.layers
+         if isinstance(layer, keras.Model) and layer.name != 'augmentation'),
+        None
+    )
 
 def create_overlay(img, heatmap, alpha=0.4):
     """Create overlay of heatmap on original image"""
@@ -127,10 +116,10 @@ def select_representative_examples(test_data, model, n_per_class=2):
         img = Image.open(item['original_path']).convert('RGB')
         img = img.resize(IMG_SIZE)
         img_array = np.array(img)
-        img_array_norm = np.expand_dims(img_array / 255.0, axis=0)
+        img_batch = np.expand_dims(img_array.astype(np.float32), axis=0)  # models rescale internally
         
         # Get prediction
-        pred_probs = model.predict(img_array_norm, verbose=0)[0]
+        pred_probs = model.predict(img_batch, verbose=0)[0]
         pred_class = np.argmax(pred_probs)
         confidence = pred_probs[pred_class]
         
@@ -161,13 +150,13 @@ def select_representative_examples(test_data, model, n_per_class=2):
 def generate_figure8(model, model_name, examples, output_path):
     """Generate Figure 8 with Grad-CAM visualizations"""
     
-    # Get last conv layer name
-    last_conv_layer_name = get_last_conv_layer_name(model, model_name)
-    if last_conv_layer_name is None:
-        print(f"ERROR: Could not find last conv layer for {model_name}")
+    # Get the backbone whose output is the last conv feature map
+    backbone = get_backbone(model)
+    if backbone is None:
+        print(f"ERROR: Could not find backbone for {model_name}")
         return
     
-    print(f"Using layer: {last_conv_layer_name}")
+    print(f"Using layer: {backbone.name}")
     
     # Create figure
     n_examples = len(examples)
@@ -183,13 +172,13 @@ def generate_figure8(model, model_name, examples, output_path):
         img = Image.open(example['path']).convert('RGB')
         img = img.resize(IMG_SIZE)
         img_array = np.array(img)
-        img_array_norm = np.expand_dims(img_array / 255.0, axis=0)
+        img_batch = np.expand_dims(img_array.astype(np.float32), axis=0)  # models rescale internally
         
         # Generate Grad-CAM heatmap
         heatmap = make_gradcam_heatmap(
-            img_array_norm, 
+            img_batch, 
             model, 
-            last_conv_layer_name,
+            backbone,
             pred_index=example['pred_class']
         )
         
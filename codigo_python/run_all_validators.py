@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Run all manuscript validators in parallel
+
+Each validator runs in its own process with its output captured, and the
+reports are printed in the usual order once they have all finished.
+"""
+
+import contextlib
+import importlib
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+VALIDATORS = [
+    'validate_content_completeness',
+    'validate_cross_references',
+    'validate_mdpi_compliance',
+    'validate_visual_elements',
+    'verify_citations',
+]
+
+def run_validator(module_name):
+    """Run one validator's main() and return its report and result"""
+    module = importlib.import_module(module_name)
+    
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        result = module.main()
+    
+    return report.getvalue(), result
+
+def main():
+    with ProcessPoolExecutor(max_workers=len(VALIDATORS)) as executor:
+        outcomes = list(executor.map(run_validator, VALIDATORS))
+    
+    failed = []
+    for module_name, (report, result) in zip(VALIDATORS, outcomes):
+        print(report, end='')
+        # Only verify_citations returns a status; the others just report
+        if result is False:
+            failed.append(module_name)
+    
+    if failed:
+        print(f"✗ Failed: {', '.join(failed)}")
+        return 1
+    
+    print("✓ All validators completed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,20 +7,109 @@ Execute comprehensive translation quality tests and generate quality report
 import re
 import os
 import sys
+import json
+import hashlib
+from bisect import bisect_right
+from itertools import count
 from datetime import datetime
 from pathlib import Path
 import subprocess
 
+class IssueBag(dict):
+    """Issues grouped by category, keeping a running total of all issues"""
+    
+    def __init__(self):
+        super().__init__()
+        self.total = 0
+    
+    def add(self, category, issues):
+        """Record the issues found for a category"""
+        self.total += len(issues) - len(self.get(category, ()))
+        self[category] = issues
+
 class ComprehensiveQualityAssurance:
     """Comprehensive Quality Assurance for English Translation - Task 14"""
     
-    def __init__(self, tex_file='artigo_cientifico_corrosao.tex'):
+    # metric -> (test method, issues category, test name, progress description)
+    QUALITY_TESTS = {
+        'technical_terminology': ('test_technical_terminology_accuracy', 'terminology',
+                                  'technical_terminology_accuracy', 'Testing technical terminology accuracy'),
+        'translation_completeness': ('test_translation_completeness', 'completeness',
+                                     'translation_completeness', 'Testing translation completeness'),
+        'latex_integrity': ('test_latex_structure_integrity', 'latex_structure',
+                            'latex_structure_integrity', 'Testing LaTeX structure integrity'),
+        'reference_consistency': ('test_reference_consistency', 'references',
+                                  'reference_consistency', 'Testing reference consistency'),
+        'abstract_structure': ('check_abstract_structure', 'abstract',
+                               'abstract_structure_compliance', 'Checking abstract structure'),
+        'academic_tone': ('analyze_academic_tone', 'tone',
+                          'academic_tone_analysis', 'Analyzing academic tone and style'),
+        'methodology_presentation': ('evaluate_methodology_presentation', 'methodology',
+                                     'methodology_presentation', 'Evaluating methodology presentation'),
+        'results_discussion': ('assess_results_discussion_quality', 'results_discussion',
+                               'results_discussion_quality', 'Assessing results and discussion quality'),
+        'engineering_terminology': ('validate_engineering_terminology', 'engineering',
+                                    'engineering_terminology_validation', 'Validating engineering terminology'),
+        'ai_ml_terminology': ('validate_ai_ml_terminology', 'ai_ml',
+                              'ai_ml_terminology_validation', 'Validating AI/ML terminology'),
+        'mathematical_notation': ('check_mathematical_notation', 'mathematics',
+                                  'mathematical_notation_consistency', 'Checking mathematical notation'),
+        'statistical_terminology': ('validate_statistical_terminology', 'statistics',
+                                    'statistical_terminology_validation', 'Validating statistical terminology'),
+    }
+    
+    # Report labels for every metric, issue category and test name
+    LABELS = {
+        name: name.replace('_', ' ').title()
+        for metric, (_, category, test_name, _) in QUALITY_TESTS.items()
+        for name in (metric, category, test_name)
+    }
+    
+    SUBTASK_METRICS = {
+        '14.1': ('technical_terminology', 'translation_completeness',
+                 'latex_integrity', 'reference_consistency'),
+        '14.2': ('abstract_structure', 'academic_tone',
+                 'methodology_presentation', 'results_discussion'),
+        '14.3': ('engineering_terminology', 'ai_ml_terminology',
+                 'mathematical_notation', 'statistical_terminology'),
+    }
+    
+    # Weights of each metric in the overall quality score
+    QUALITY_WEIGHTS = {
+        'technical_terminology': 0.15,
+        'translation_completeness': 0.15,
+        'latex_integrity': 0.10,
+        'reference_consistency': 0.10,
+        'abstract_structure': 0.10,
+        'academic_tone': 0.10,
+        'methodology_presentation': 0.10,
+        'results_discussion': 0.10,
+        'engineering_terminology': 0.05,
+        'ai_ml_terminology': 0.05,
+        'mathematical_notation': 0.05,
+        'statistical_terminology': 0.05
+    }
+    
+    TOTAL_WEIGHT = sum(QUALITY_WEIGHTS.values())
+    
+    # Lower score bound of each quality level above 'Needs Improvement'
+    QUALITY_THRESHOLDS = (0.60, 0.75, 0.85, 0.95)
+    QUALITY_LEVELS = ('Needs Improvement', 'Acceptable', 'Good', 'Very Good', 'Excellent')
+    
+    # Bump when the quality tests change so stale cached results are ignored
+    CACHE_VERSION = 2
+    
+    def __init__(self, tex_file='artigo_cientifico_corrosao.tex', cache_dir='.qa_cache'):
         self.tex_file = tex_file
+        self.cache_dir = Path(cache_dir)
+        self._content = None
+        self._content_lower = ''
+        self._tokens = frozenset()
         self.qa_results = {
             'timestamp': datetime.now().strftime('%Y%m%d_%H%M%S'),
             'tests_performed': [],
             'quality_scores': {},
-            'issues_found': {},
+            'issues_found': IssueBag(),
             'recommendations': []
         }
         
@@ -33,20 +122,29 @@ class ComprehensiveQualityAssurance:
         print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         
         try:
-            # Sub-task 14.1: Execute comprehensive translation quality tests
-            print("SUB-TASK 14.1: Executing comprehensive translation quality tests")
-            print("-" * 60)
-            self.execute_comprehensive_quality_tests()
-            
-            # Sub-task 14.2: Verify academic writing quality meets English standards
-            print("\nSUB-TASK 14.2: Verifying academic writing quality standards")
-            print("-" * 60)
-            self.verify_academic_writing_standards()
+            cache_file = self.get_cache_file()
             
-            # Sub-task 14.3: Check technical accuracy of all translated content
-            print("\nSUB-TASK 14.3: Checking technical accuracy of translated content")
-            print("-" * 60)
-            self.check_technical_accuracy()
+            if cache_file and self.load_cached_results(cache_file):
+                print("Document unchanged since last run: reusing cached quality test results")
+                print(f"Cache: {cache_file}")
+            else:
+                # Sub-task 14.1: Execute comprehensive translation quality tests
+                print("SUB-TASK 14.1: Executing comprehensive translation quality tests")
+                print("-" * 60)
+                self.execute_comprehensive_quality_tests()
+                
+                # Sub-task 14.2: Verify academic writing quality meets English standards
+                print("\nSUB-TASK 14.2: Verifying academic writing quality standards")
+                print("-" * 60)
+                self.verify_academic_writing_standards()
+                
+                # Sub-task 14.3: Check technical accuracy of all translated content
+                print("\nSUB-TASK 14.3: Checking technical accuracy of translated content")
+                print("-" * 60)
+                self.check_technical_accuracy()
+                
+                if cache_file:
+                    self.save_cached_results(cache_file)
             
             # Sub-task 14.4: Generate translation quality report
             print("\nSUB-TASK 14.4: Generating comprehensive translation quality report")
@@ -79,123 +177,96 @@ class ComprehensiveQualityAssurance:
         """Execute comprehensive translation quality tests"""
         
         print("Executing comprehensive quality tests...")
-        
-        # Test 1: Technical terminology accuracy
-        print("  → Testing technical terminology accuracy...")
-        term_score, term_issues = self.test_technical_terminology_accuracy()
-        self.qa_results['quality_scores']['technical_terminology'] = term_score
-        self.qa_results['issues_found']['terminology'] = term_issues
-        self.qa_results['tests_performed'].append('technical_terminology_accuracy')
-        print(f"    Score: {term_score * 100:.1f}%")
-        
-        # Test 2: Translation completeness
-        print("  → Testing translation completeness...")
-        complete_score, complete_issues = self.test_translation_completeness()
-        self.qa_results['quality_scores']['translation_completeness'] = complete_score
-        self.qa_results['issues_found']['completeness'] = complete_issues
-        self.qa_results['tests_performed'].append('translation_completeness')
-        print(f"    Score: {complete_score * 100:.1f}%")
-        
-        # Test 3: LaTeX structure integrity
-        print("  → Testing LaTeX structure integrity...")
-        latex_score, latex_issues = self.test_latex_structure_integrity()
-        self.qa_results['quality_scores']['latex_integrity'] = latex_score
-        self.qa_results['issues_found']['latex_structure'] = latex_issues
-        self.qa_results['tests_performed'].append('latex_structure_integrity')
-        print(f"    Score: {latex_score * 100:.1f}%")
-        
-        # Test 4: Reference consistency
-        print("  → Testing reference consistency...")
-        ref_score, ref_issues = self.test_reference_consistency()
-        self.qa_results['quality_scores']['reference_consistency'] = ref_score
-        self.qa_results['issues_found']['references'] = ref_issues
-        self.qa_results['tests_performed'].append('reference_consistency')
-        print(f"    Score: {ref_score * 100:.1f}%")
+        self.run_quality_tests(self.SUBTASK_METRICS['14.1'])
     
     def verify_academic_writing_standards(self):
         """Verify academic writing quality meets English standards"""
         
         print("Verifying academic writing standards...")
-        
-        # Test 1: Abstract structure compliance
-        print("  → Checking abstract structure...")
-        abstract_score, abstract_issues = self.check_abstract_structure()
-        self.qa_results['quality_scores']['abstract_structure'] = abstract_score
-        self.qa_results['issues_found']['abstract'] = abstract_issues
-        self.qa_results['tests_performed'].append('abstract_structure_compliance')
-        print(f"    Score: {abstract_score * 100:.1f}%")
-        
-        # Test 2: Academic tone and style
-        print("  → Analyzing academic tone and style...")
-        tone_score, tone_issues = self.analyze_academic_tone()
-        self.qa_results['quality_scores']['academic_tone'] = tone_score
-        self.qa_results['issues_found']['tone'] = tone_issues
-        self.qa_results['tests_performed'].append('academic_tone_analysis')
-        print(f"    Score: {tone_score * 100:.1f}%")
-        
-        # Test 3: Scientific methodology presentation
-        print("  → Evaluating methodology presentation...")
-        method_score, method_issues = self.evaluate_methodology_presentation()
-        self.qa_results['quality_scores']['methodology_presentation'] = method_score
-        self.qa_results['issues_found']['methodology'] = method_issues
-        self.qa_results['tests_performed'].append('methodology_presentation')
-        print(f"    Score: {method_score * 100:.1f}%")
-        
-        # Test 4: Results and discussion quality
-        print("  → Assessing results and discussion quality...")
-        results_score, results_issues = self.assess_results_discussion_quality()
-        self.qa_results['quality_scores']['results_discussion'] = results_score
-        self.qa_results['issues_found']['results_discussion'] = results_issues
-        self.qa_results['tests_performed'].append('results_discussion_quality')
-        print(f"    Score: {results_score * 100:.1f}%")
+        self.run_quality_tests(self.SUBTASK_METRICS['14.2'])
     
     def check_technical_accuracy(self):
         """Check technical accuracy of all translated content"""
         
         print("Checking technical accuracy of translated content...")
+        self.run_quality_tests(self.SUBTASK_METRICS['14.3'])
+    
+    def run_quality_tests(self, metrics):
+        """Run quality tests in order and record their results"""
+        
+        for metric in metrics:
+            method_name, category, test_name, description = self.QUALITY_TESTS[metric]
+            print(f"  → {description}...")
+            score, issues = getattr(self, method_name)()
+            self.qa_results['quality_scores'][metric] = score
+            self.qa_results['issues_found'].add(category, issues)
+            self.qa_results['tests_performed'].append(test_name)
+            print(f"    Score: {score * 100:.1f}%")
+    
+    def get_cache_file(self):
+        """Return the cache file for the current document content, or None if unreadable"""
+        try:
+            raw = Path(self.tex_file).read_bytes()
+        except OSError:
+            return None
         
-        # Test 1: Engineering terminology accuracy
-        print("  → Validating engineering terminology...")
-        eng_score, eng_issues = self.validate_engineering_terminology()
-        self.qa_results['quality_scores']['engineering_terminology'] = eng_score
-        self.qa_results['issues_found']['engineering'] = eng_issues
-        self.qa_results['tests_performed'].append('engineering_terminology_validation')
-        print(f"    Score: {eng_score * 100:.1f}%")
-        
-        # Test 2: AI/ML terminology accuracy
-        print("  → Validating AI/ML terminology...")
-        ai_score, ai_issues = self.validate_ai_ml_terminology()
-        self.qa_results['quality_scores']['ai_ml_terminology'] = ai_score
-        self.qa_results['issues_found']['ai_ml'] = ai_issues
-        self.qa_results['tests_performed'].append('ai_ml_terminology_validation')
-        print(f"    Score: {ai_score * 100:.1f}%")
-        
-        # Test 3: Mathematical notation consistency
-        print("  → Checking mathematical notation...")
-        math_score, math_issues = self.check_mathematical_notation()
-        self.qa_results['quality_scores']['mathematical_notation'] = math_score
-        self.qa_results['issues_found']['mathematics'] = math_issues
-        self.qa_results['tests_performed'].append('mathematical_notation_consistency')
-        print(f"    Score: {math_score * 100:.1f}%")
-        
-        # Test 4: Statistical terminology accuracy
-        print("  → Validating statistical terminology...")
-        stats_score, stats_issues = self.validate_statistical_terminology()
-        self.qa_results['quality_scores']['statistical_terminology'] = stats_score
-        self.qa_results['issues_found']['statistics'] = stats_issues
-        self.qa_results['tests_performed'].append('statistical_terminology_validation')
-        print(f"    Score: {stats_score * 100:.1f}%")
+        digest = hashlib.blake2b(raw, digest_size=16)
+        digest.update(str(self.CACHE_VERSION).encode())
+        return self.cache_dir / f'{digest.hexdigest()}.json'
     
-    def read_tex_file(self):
-        """Read LaTeX file content safely"""
+    def load_cached_results(self, cache_file):
+        """Load cached quality test results; returns False on a cache miss"""
         try:
-            if not os.path.exists(self.tex_file):
-                return ""
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        self.qa_results['quality_scores'] = cached['quality_scores']
+        self.qa_results['tests_performed'] = cached['tests_performed']
+        for category, issues in cached['issues_found'].items():
+            self.qa_results['issues_found'].add(category, issues)
+        return True
+    
+    def save_cached_results(self, cache_file):
+        """Save quality test results atomically so readers never see a partial file"""
+        cached = {key: self.qa_results[key] for key in ('quality_scores', 'issues_found', 'tests_performed')}
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(cached, f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: could not write quality cache: {e}")
+    
+    def read_tex_file(self):
+        """Read LaTeX file content safely, once per run"""
+        if self._content is None:
+            try:
+                if not os.path.exists(self.tex_file):
+                    self._content = ""
+                else:
+                    with open(self.tex_file, 'r', encoding='utf-8') as f:
+                        self._content = f.read()
+            except Exception:
+                self._content = ""
             
-            with open(self.tex_file, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception:
-            return ""
+            # Shared by all terminology checks
+            self._content_lower = self._content.lower()
+            self._tokens = frozenset(re.findall(r'\w+', self._content_lower))
+        
+        return self._content
+    
+    def contains_term(self, term):
+        """Check whether a term occurs in the document, ignoring case"""
+        term = term.lower()
+        
+        # Single words are looked up in the word set; phrases need a substring search
+        if re.fullmatch(r'\w+', term):
+            return term in self._tokens
+        return term in self._content_lower
     
     def test_technical_terminology_accuracy(self):
         """Test technical terminology accuracy and consistency"""
@@ -208,7 +279,7 @@ class ComprehensiveQualityAssurance:
                 issues.append('Could not read LaTeX file')
                 return 0, issues
             
-            content_lower = content.lower()
+            content_lower = self._content_lower
             
             # Required English technical terms
             required_terms = [
@@ -230,7 +301,7 @@ class ComprehensiveQualityAssurance:
             # Check for required English terms
             terms_found = 0
             for term in required_terms:
-                if term.lower() in content_lower:
+                if self.contains_term(term):
                     terms_found += 1
                 else:
                     issues.append(f'Missing technical term: {term}')
@@ -238,7 +309,11 @@ class ComprehensiveQualityAssurance:
             # Check for Portuguese terms (should not be present)
             portuguese_found = 0
             for term in portuguese_terms:
-                if re.search(r'\b' + re.escape(term) + r'\b', content_lower):
+                if ' ' in term:
+                    found = re.search(r'\b' + re.escape(term) + r'\b', content_lower)
+                else:
+                    found = term in self._tokens
+                if found:
                     portuguese_found += 1
                     issues.append(f'Portuguese term found: {term}')
             
@@ -479,7 +554,7 @@ class ComprehensiveQualityAssurance:
                 issues.append('Could not read LaTeX file')
                 return 0, issues
             
-            content_lower = content.lower()
+            content_lower = self._content_lower
             
             # Check for academic indicators
             academic_indicators = [
@@ -574,7 +649,7 @@ class ComprehensiveQualityAssurance:
                 issues.append('Could not read LaTeX file')
                 return 0, issues
             
-            content_lower = content.lower()
+            content_lower = self._content_lower
             
             # Check for statistical terminology in results
             stats_terms = ['p <', 'confidence interval', 'standard deviation', 'significant', 'correlation']
@@ -620,8 +695,6 @@ class ComprehensiveQualityAssurance:
                 issues.append('Could not read LaTeX file')
                 return 0, issues
             
-            content_lower = content.lower()
-            
             # Engineering terms that should be present
             engineering_terms = [
                 'ASTM A572 Grade 50', 'W-beams', 'structural inspection',
@@ -631,7 +704,7 @@ class ComprehensiveQualityAssurance:
             
             terms_found = 0
             for term in engineering_terms:
-                if term.lower() in content_lower:
+                if self.contains_term(term):
                     terms_found += 1
                 else:
                     issues.append(f'Missing engineering term: {term}')
@@ -655,8 +728,6 @@ class ComprehensiveQualityAssurance:
                 issues.append('Could not read LaTeX file')
                 return 0, issues
             
-            content_lower = content.lower()
-            
             # AI/ML terms that should be present
             ai_ml_terms = [
                 'convolutional neural networks', 'semantic segmentation',
@@ -666,7 +737,7 @@ class ComprehensiveQualityAssurance:
             
             terms_found = 0
             for term in ai_ml_terms:
-                if term.lower() in content_lower:
+                if self.contains_term(term):
                     terms_found += 1
                 else:
                     issues.append(f'Missing AI/ML term: {term}')
@@ -732,8 +803,6 @@ class ComprehensiveQualityAssurance:
                 issues.append('Could not read LaTeX file')
                 return 0, issues
             
-            content_lower = content.lower()
-            
             # Statistical terms that should be present
             stats_terms = [
                 'IoU', 'Dice coefficient', 'precision', 'recall',
@@ -742,7 +811,7 @@ class ComprehensiveQualityAssurance:
             
             terms_found = 0
             for term in stats_terms:
-                if term.lower() in content_lower:
+                if self.contains_term(term):
                     terms_found += 1
                 else:
                     issues.append(f'Missing statistical term: {term}')
@@ -758,47 +827,24 @@ class ComprehensiveQualityAssurance:
     def calculate_overall_quality_score(self):
         """Calculate overall quality score with weighted average"""
         
-        # Define weights for different quality aspects
-        weights = {
-            'technical_terminology': 0.15,
-            'translation_completeness': 0.15,
-            'latex_integrity': 0.10,
-            'reference_consistency': 0.10,
-            'abstract_structure': 0.10,
-            'academic_tone': 0.10,
-            'methodology_presentation': 0.10,
-            'results_discussion': 0.10,
-            'engineering_terminology': 0.05,
-            'ai_ml_terminology': 0.05,
-            'mathematical_notation': 0.05,
-            'statistical_terminology': 0.05
-        }
+        scores = self.qa_results['quality_scores']
         
         # Calculate weighted average
-        total_score = 0
-        total_weight = 0
-        
-        for metric, weight in weights.items():
-            if metric in self.qa_results['quality_scores']:
-                total_score += self.qa_results['quality_scores'][metric] * weight
-                total_weight += weight
-        
-        if total_weight > 0:
-            overall_score = total_score / total_weight
+        if scores.keys() >= self.QUALITY_WEIGHTS.keys():
+            # Every metric was measured: the divisor is the constant total weight
+            overall_score = sum(scores[metric] * weight for metric, weight in self.QUALITY_WEIGHTS.items()) / self.TOTAL_WEIGHT
         else:
-            overall_score = 0
+            # Renormalize over the metrics that were measured
+            present = [(scores[metric], weight) for metric, weight in self.QUALITY_WEIGHTS.items() if metric in scores]
+            total_weight = sum(weight for _, weight in present)
+            
+            if total_weight > 0:
+                overall_score = sum(score * weight for score, weight in present) / total_weight
+            else:
+                overall_score = 0
         
         # Determine quality level
-        if overall_score >= 0.95:
-            quality_level = 'Excellent'
-        elif overall_score >= 0.85:
-            quality_level = 'Very Good'
-        elif overall_score >= 0.75:
-            quality_level = 'Good'
-        elif overall_score >= 0.60:
-            quality_level = 'Acceptable'
-        else:
-            quality_level = 'Needs Improvement'
+        quality_level = self.QUALITY_LEVELS[bisect_right(self.QUALITY_THRESHOLDS, overall_score)]
         
         return overall_score, quality_level
     
@@ -854,84 +900,88 @@ class ComprehensiveQualityAssurance:
         report_file = f'comprehensive_quality_report_{timestamp}.txt'
         
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                # Header
-                f.write('COMPREHENSIVE TRANSLATION QUALITY ASSURANCE REPORT\n')
-                f.write('=' * 60 + '\n')
-                f.write(f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
-                f.write(f'Document: {self.tex_file}\n')
-                f.write('Task: 14 - Final Quality Assurance Review\n\n')
-                
-                # Overall Assessment
-                f.write('OVERALL ASSESSMENT\n')
-                f.write('=' * 20 + '\n')
-                f.write(f'Overall Quality Score: {self.qa_results["overall_score"] * 100:.1f}%\n')
-                f.write(f'Quality Level: {self.qa_results["quality_level"]}\n\n')
-                
-                # Detailed Scores
-                f.write('DETAILED QUALITY SCORES\n')
-                f.write('=' * 25 + '\n')
-                for metric, score in self.qa_results['quality_scores'].items():
-                    metric_name = metric.replace('_', ' ').title()
-                    f.write(f'{metric_name:<30}: {score * 100:6.1f}%\n')
-                
-                # Issues Found
-                f.write('\nISSUES IDENTIFIED\n')
-                f.write('=' * 20 + '\n')
-                issue_count = 1
-                
-                for category, issues in self.qa_results['issues_found'].items():
-                    if issues:
-                        f.write(f'\n{category.replace("_", " ").title()} Issues:\n')
-                        f.write('-' * (len(category) + 8) + '\n')
-                        for issue in issues:
-                            f.write(f'{issue_count}. {issue}\n')
-                            issue_count += 1
-                
-                # Recommendations
-                f.write('\nRECOMMENDATIONS\n')
-                f.write('=' * 15 + '\n')
-                for i, rec in enumerate(self.qa_results['recommendations'], 1):
-                    f.write(f'{i}. {rec}\n\n')
-                
-                # Tests Performed
-                f.write('TESTS PERFORMED\n')
-                f.write('=' * 15 + '\n')
-                for test in self.qa_results['tests_performed']:
-                    test_name = test.replace('_', ' ').title()
-                    f.write(f'✓ {test_name}\n')
-                
-                # Quality Criteria
-                f.write('\nQUALITY CRITERIA\n')
-                f.write('=' * 16 + '\n')
-                f.write('Excellent (95-100%):     Publication ready\n')
-                f.write('Very Good (85-94%):      Minor revisions needed\n')
-                f.write('Good (75-84%):           Moderate revisions needed\n')
-                f.write('Acceptable (60-74%):     Major revisions needed\n')
-                f.write('Needs Improvement (<60%): Significant work required\n\n')
-                
-                # Final Assessment
-                f.write('FINAL ASSESSMENT\n')
-                f.write('=' * 16 + '\n')
-                overall_score = self.qa_results['overall_score']
-                if overall_score >= 0.95:
-                    f.write('✓ RESULT: Translation is PUBLICATION READY\n')
-                    f.write('The document meets all quality standards for international publication.\n')
-                elif overall_score >= 0.85:
-                    f.write('⚠ RESULT: Translation needs MINOR REVISIONS\n')
-                    f.write('The document is of high quality but requires minor improvements.\n')
-                elif overall_score >= 0.75:
-                    f.write('⚠ RESULT: Translation needs MODERATE REVISIONS\n')
-                    f.write('The document requires moderate improvements before publication.\n')
-                elif overall_score >= 0.60:
-                    f.write('⚠ RESULT: Translation needs MAJOR REVISIONS\n')
-                    f.write('The document requires significant improvements before publication.\n')
-                else:
-                    f.write('❌ RESULT: Translation needs SIGNIFICANT WORK\n')
-                    f.write('The document requires extensive revision before publication consideration.\n')
-                
-                f.write('\nEND OF REPORT\n')
-                f.write('=' * 13 + '\n')
+            parts = []
+            
+            # Header
+            parts.append('COMPREHENSIVE TRANSLATION QUALITY ASSURANCE REPORT\n')
+            parts.append('=' * 60 + '\n')
+            parts.append(f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
+            parts.append(f'Document: {self.tex_file}\n')
+            parts.append('Task: 14 - Final Quality Assurance Review\n\n')
+            
+            # Overall Assessment
+            parts.append('OVERALL ASSESSMENT\n')
+            parts.append('=' * 20 + '\n')
+            parts.append(f'Overall Quality Score: {self.qa_results["overall_score"] * 100:.1f}%\n')
+            parts.append(f'Quality Level: {self.qa_results["quality_level"]}\n\n')
+            
+            # Detailed Scores
+            parts.append('DETAILED QUALITY SCORES\n')
+            parts.append('=' * 25 + '\n')
+            parts.append(''.join(
+                f'{self.LABELS[metric]:<30}: {score * 100:6.1f}%\n'
+                for metric, score in self.qa_results['quality_scores'].items()
+            ))
+            
+            # Issues Found
+            parts.append('\nISSUES IDENTIFIED\n')
+            parts.append('=' * 20 + '\n')
+            issue_numbers = count(1)
+            
+            for category, issues in self.qa_results['issues_found'].items():
+                if issues:
+                    parts.append(f'\n{self.LABELS[category]} Issues:\n')
+                    parts.append('-' * (len(category) + 8) + '\n')
+                    parts.append(''.join(f'{n}. {issue}\n' for issue, n in zip(issues, issue_numbers)))
+            
+            # Recommendations
+            parts.append('\nRECOMMENDATIONS\n')
+            parts.append('=' * 15 + '\n')
+            parts.append(''.join(
+                f'{i}. {rec}\n\n' for i, rec in enumerate(self.qa_results['recommendations'], 1)
+            ))
+            
+            # Tests Performed
+            parts.append('TESTS PERFORMED\n')
+            parts.append('=' * 15 + '\n')
+            parts.append(''.join(
+                f'✓ {self.LABELS[test]}\n' for test in self.qa_results['tests_performed']
+            ))
+            
+            # Quality Criteria
+            parts.append('\nQUALITY CRITERIA\n')
+            parts.append('=' * 16 + '\n')
+            parts.append('Excellent (95-100%):     Publication ready\n'
+                         'Very Good (85-94%):      Minor revisions needed\n'
+                         'Good (75-84%):           Moderate revisions needed\n'
+                         'Acceptable (60-74%):     Major revisions needed\n'
+                         'Needs Improvement (<60%): Significant work required\n\n')
+            
+            # Final Assessment
+            parts.append('FINAL ASSESSMENT\n')
+            parts.append('=' * 16 + '\n')
+            overall_score = self.qa_results['overall_score']
+            if overall_score >= 0.95:
+                parts.append('✓ RESULT: Translation is PUBLICATION READY\n')
+                parts.append('The document meets all quality standards for international publication.\n')
+            elif overall_score >= 0.85:
+                parts.append('⚠ RESULT: Translation needs MINOR REVISIONS\n')
+                parts.append('The document is of high quality but requires minor improvements.\n')
+            elif overall_score >= 0.75:
+                parts.append('⚠ RESULT: Translation needs MODERATE REVISIONS\n')
+                parts.append('The document requires moderate improvements before publication.\n')
+            elif overall_score >= 0.60:
+                parts.append('⚠ RESULT: Translation needs MAJOR REVISIONS\n')
+                parts.append('The document requires significant improvements before publication.\n')
+            else:
+                parts.append('❌ RESULT: Translation needs SIGNIFICANT WORK\n')
+                parts.append('The document requires extensive revision before publication consideration.\n')
+            
+            parts.append('\nEND OF REPORT\n')
+            parts.append('=' * 13 + '\n')
+            
+            # Write the whole report in a single call
+            Path(report_file).write_text(''.join(parts), encoding='utf-8')
             
             return report_file
             
@@ -948,16 +998,13 @@ class ComprehensiveQualityAssurance:
         
         print(f'Overall Quality Score: {self.qa_results["overall_score"] * 100:.1f}% ({self.qa_results["quality_level"]})')
         
-        # Count total issues
-        total_issues = sum(len(issues) for issues in self.qa_results['issues_found'].values() if isinstance(issues, list))
-        
-        print(f'Total Issues Found: {total_issues}')
+        print(f'Total Issues Found: {self.qa_results["issues_found"].total}')
         print(f'Recommendations: {len(self.qa_results["recommendations"])}')
         print(f'Tests Performed: {len(self.qa_results["tests_performed"])}')
         
         print('\nQUALITY BREAKDOWN:')
         for metric, score in self.qa_results['quality_scores'].items():
-            metric_name = metric.replace('_', ' ').title()
+            metric_name = self.LABELS[metric]
             
             if score >= 0.9:
                 status = '✓ Excellent'
@@ -7,6 +7,7 @@ This script executes Task 13 validation for the English translation article.
 
 import sys
 import os
+import json
 from pathlib import Path
 
 # Add src directory to path
@@ -14,6 +15,38 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from validation.latex_compilation_validator import LaTeXCompilationValidator
 
+TEX_FILE = "artigo_cientifico_corrosao.tex"
+BIB_FILE = "referencias.bib"
+CACHE_FILE = Path(".latex_validation.cache")
+
+def validation_key():
+    """Identify the validation inputs by modification time and size."""
+    key = []
+    for path in (TEX_FILE, BIB_FILE):
+        try:
+            stat = os.stat(path)
+            key.append([stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            key.append(None)
+    return key
+
+def load_cached_result(key):
+    """Return True if the last validation of identical inputs passed."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return cached.get('key') == key and cached.get('ok', False)
+
+def save_cached_result(key, all_passed):
+    """Record the outcome of a validation run for the given inputs."""
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'ok': all_passed}, f)
+    except OSError as e:
+        print(f"⚠️  Could not write validation cache: {e}")
+
 def main():
     """Run the LaTeX validation for Task 13."""
     print("TASK 13: LaTeX Compilation and Formatting Validation")
@@ -22,7 +55,14 @@ def main():
     print()
     
     # Initialize validator
-    validator = LaTeXCompilationValidator("artigo_cientifico_corrosao.tex")
+    validator = LaTeXCompilationValidator(TEX_FILE)
+    
+    # Skip the full validation when the inputs are unchanged since a passing run
+    key = validation_key()
+    if "--force" not in sys.argv and load_cached_result(key):
+        print("✓ LaTeX sources unchanged since the last successful validation; skipping.")
+        print("  Use --force to validate again.")
+        return 0
     
     # Run complete validation
     try:
@@ -33,6 +73,7 @@ def main():
             all(category_results.values()) 
             for category_results in results.values()
         )
+        save_cached_result(key, all_passed)
         
         if all_passed:
             print("\n🎉 All LaTeX validation checks passed!")
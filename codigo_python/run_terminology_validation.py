@@ -7,9 +7,20 @@ Demonstrates the complete validation system functionality.
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src', 'translation'))
+# Add src directory to path (once, even if this module is reloaded)
+TRANSLATION_DIR = os.path.join(os.path.dirname(__file__), 'src', 'translation')
+if TRANSLATION_DIR not in sys.path:
+    sys.path.insert(0, TRANSLATION_DIR)
+
+@lru_cache(maxsize=None)
+def get_validator():
+    """Import the validation components and build the publication validator once per process."""
+    from terminology_validator import TerminologyValidator
+    from validation_config import publication_config
+    
+    return TerminologyValidator(config=publication_config)
 
 def main():
     """Run comprehensive terminology validation."""
@@ -27,17 +38,14 @@ def main():
         return 1
     
     try:
-        # Import validation components
-        from terminology_validator import TerminologyValidator
-        from validation_config import ValidationConfig, publication_config
+        # Import validation components and initialize the validator with the
+        # publication-ready configuration; repeated main() calls reuse both
+        validator = get_validator()
         
         print("✓ Validation system loaded successfully")
         print(f"✓ Document found: {tex_file}")
         print()
         
-        # Initialize validator with publication-ready configuration
-        validator = TerminologyValidator(config=publication_config)
-        
         print("Running comprehensive validation...")
         print("-" * 30)
         
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Smoke test for Grad-CAM on the built models (run with: python -m unittest test_generate_gradcam_figure)
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import train_all_models
+from generate_gradcam_figure import IMG_SIZE, get_backbone, make_gradcam_heatmap
+
+def without_pretrained_weights(application):
+    """Build an application backbone without downloading ImageNet weights"""
+    return lambda **kwargs: application(**{**kwargs, 'weights': None})
+
+class GradcamSmokeTest(unittest.TestCase):
+    @mock.patch.object(train_all_models, 'EfficientNetB0',
+                       without_pretrained_weights(train_all_models.EfficientNetB0))
+    @mock.patch.object(train_all_models, 'ResNet50',
+                       without_pretrained_weights(train_all_models.ResNet50))
+    def test_heatmap_for_each_model(self):
+        img_batch = np.random.default_rng(0).uniform(0, 255, (1, *IMG_SIZE, 3)).astype(np.float32)
+
+        for build in (train_all_models.build_resnet50, train_all_models.build_efficientnet):
+            model = build()
+            with self.subTest(model=model.name):
+                backbone = get_backbone(model)
+                self.assertIsNotNone(backbone)
+                self.assertNotEqual(backbone.name, 'augmentation')
+
+                heatmap = make_gradcam_heatmap(img_batch, model, backbone)
+                self.assertEqual(heatmap.shape, tuple(backbone.output.shape[1:3]))
+
+if __name__ == '__main__':
+    unittest.main()
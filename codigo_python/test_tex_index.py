@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared LaTeX index (run with: python -m unittest test_tex_index)
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import tex_index
+from tex_index import index_file, load_index
+
+class IndexFileTest(unittest.TestCase):
+    def write_tex(self, content):
+        fd, path = tempfile.mkstemp(suffix='.tex')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_empty_file_gives_empty_index(self):
+        index = index_file(self.write_tex(b''))
+        self.assertEqual(index.sections, [])
+        self.assertEqual(dict(index.labels), {})
+        self.assertEqual(dict(index.references), {})
+        self.assertEqual(index.citations, 0)
+
+    def test_sections_labels_references_and_citations(self):
+        index = index_file(self.write_tex(
+            '\\section{Introdução}\\label{sec:intro}\n'
+            '\\subsection{Data}\\ref{fig:a}\\cite{x,y}\n'.encode('utf-8')
+        ))
+        self.assertEqual(index.sections, [(0, 'Introdução'), (1, 'Data')])
+        self.assertEqual(index.labels['sec'], ['intro'])
+        self.assertEqual(index.references['fig'], ['a'])
+        self.assertEqual(index.citations, 1)
+
+class LoadIndexTest(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.object(tex_index, 'CACHE_DIR', Path(cache_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        fd, self.tex_file = tempfile.mkstemp(suffix='.tex')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'\\section{Results}\\label{sec:results}\n')
+        self.addCleanup(os.remove, self.tex_file)
+
+    def test_corrupt_cache_entry_is_rebuilt(self):
+        load_index(self.tex_file)
+        [cache_file] = tex_index.CACHE_DIR.iterdir()
+        cache_file.write_bytes(b'\x80\x04\x95truncated')
+
+        self.assertEqual(load_index(self.tex_file).sections, [(0, 'Results')])
+        self.assertEqual(list(tex_index.CACHE_DIR.iterdir()), [cache_file])
+
+if __name__ == '__main__':
+    unittest.main()
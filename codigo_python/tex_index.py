@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Single-pass index of a LaTeX manuscript shared by the validators
+
+One compiled alternation classifies sections, labels, references and
+citations, so each document is walked by the regex engine exactly once.
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Section titles sit in a lookahead so commands inside them are still visited.
+# Patterns are bytes so files can be scanned in place via mmap
+TOKEN_RE = re.compile(
+    rb'\\(?P<level>section|subsection|subsubsection)\{(?=(?P<title>[^}]+)\})'
+    rb'|\\(?P<command>label|ref)\{(?P<kind>[^:}]+):(?P<name>[^}]+)\}'
+    rb'|\\cite\{[^}]+\}'
+)
+
+SECTION_DEPTH = {b'section': 0, b'subsection': 1, b'subsubsection': 2}
+
+CACHE_DIR = Path('.tex_cache')
+# Bump when TOKEN_RE or TexIndex change so stale cached indexes are ignored
+CACHE_VERSION = 2
+
+@dataclass
+class TexIndex:
+    """Sections as (depth, title), labels and references by type, and citation count of one document"""
+    sections: list = field(default_factory=list)
+    labels: defaultdict = field(default_factory=lambda: defaultdict(list))
+    references: defaultdict = field(default_factory=lambda: defaultdict(list))
+    citations: int = 0
+
+def build_index(content):
+    """Index UTF-8 LaTeX bytes, decoding only the captured groups"""
+    index = TexIndex()
+    targets = {b'label': index.labels, b'ref': index.references}
+
+    for match in TOKEN_RE.finditer(content):
+        level, command = match.group('level', 'command')
+        if level:
+            index.sections.append((SECTION_DEPTH[level], match.group('title').decode('utf-8')))
+        elif command:
+            kind, name = match.group('kind', 'name')
+            targets[command][kind.decode('utf-8')].append(name.decode('utf-8'))
+        else:
+            index.citations += 1
+
+    return index
+
+def index_file(tex_file):
+    """Memory-map a LaTeX file and index it without copying it into a str"""
+    with open(tex_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap rejects empty files
+            return TexIndex()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return build_index(content)
+
+def load_index(tex_file):
+    """Return the index of a LaTeX file, reusing the cached copy while the file is unchanged"""
+    stat = os.stat(tex_file)
+    key = f'{CACHE_VERSION}:{os.path.abspath(tex_file)}:{stat.st_mtime_ns}:{stat.st_size}'
+    cache_file = CACHE_DIR / hashlib.md5(key.encode('utf-8')).hexdigest()
+    
+    try:
+        return pickle.loads(cache_file.read_bytes())
+    except Exception:  # missing, truncated or otherwise unreadable entry: rebuild it
+        pass
+    
+    index = index_file(tex_file)
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        # Validators index the same file in parallel processes, so write a
+        # per-process temp file and rename it; readers never see a partial entry
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_file.write_bytes(pickle.dumps(index))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"⚠️  Could not write TeX index cache: {e}")
+    
+    return index
@@ -11,6 +11,40 @@ import subprocess
 import sys
 from pathlib import Path
 
+# Patterns are compiled once at import instead of on every validation call
+DOCUMENT_CLASS_RE = re.compile(r'\\documentclass\[([^\]]*)\]\{ascelike-new\}')
+REQUIRED_PACKAGES = [
+    'inputenc', 'fontenc', 'babel', 'lmodern', 'graphicx',
+    'caption', 'subcaption', 'amsmath', 'siunitx', 'booktabs',
+    'array', 'multirow', 'newtxtext', 'hyperref'
+]
+# Zero-width lookahead reports every package name at every position, including
+# overlapping ones ('caption' inside 'subcaption'), in one pass over the text
+PACKAGE_SCANNER = re.compile('(?=(%s))' % '|'.join(map(re.escape, REQUIRED_PACKAGES)))
+REQUIRED_SECTIONS = [
+    (re.compile(r'\\begin\{abstract\}'), 'Abstract environment'),
+    (re.compile(r'\\section\{Practical Applications\}'), 'Practical Applications section'),
+    (re.compile(r'\\section\{Introduction\}'), 'Introduction section'),
+    (re.compile(r'\\section\{Data Availability Statement\}'), 'Data Availability Statement'),
+    (re.compile(r'\\KeyWords\{'), 'Keywords command')
+]
+ELEMENT_PATTERNS = {
+    'figures': re.compile(r'\\begin\{figure\}'),
+    'tables': re.compile(r'\\begin\{table\}'),
+    'equations': re.compile(r'\\begin\{equation\}'),
+    'sections': re.compile(r'\\section\{'),
+    'subsections': re.compile(r'\\subsection\{'),
+}
+FIGURE_RE = re.compile(r'\\begin\{figure\}.*?\\end\{figure\}', re.DOTALL)
+TABLE_RE = re.compile(r'\\begin\{table\}.*?\\end\{table\}', re.DOTALL)
+EQUATION_RE = re.compile(r'\\begin\{equation\}.*?\\end\{equation\}', re.DOTALL)
+LABELED_EQUATION_RE = re.compile(r'\\begin\{equation\}.*?\\label\{.*?\}.*?\\end\{equation\}', re.DOTALL)
+CITE_PATTERNS = [
+    (re.compile(r'\\cite\{[^}]+\}'), 'Standard citations'),
+    (re.compile(r'\\citeA\{[^}]+\}'), 'Author citations'),
+    (re.compile(r'\\citeN\{[^}]+\}'), 'Numeric citations')
+]
+
 class ASCEValidator:
     def __init__(self, asce_file="artigo_cientifico_corrosao.tex", original_file="artigo_cientifico_corrosao_original_portuguese_backup.tex"):
         self.asce_file = asce_file
@@ -34,8 +68,7 @@ class ASCEValidator:
         print("\n=== ASCE Document Class Validation ===")
         
         # Check for ascelike-new class
-        class_pattern = r'\\documentclass\[([^\]]*)\]\{ascelike-new\}'
-        class_match = re.search(class_pattern, content)
+        class_match = DOCUMENT_CLASS_RE.search(content)
         
         if class_match:
             options = class_match.group(1)
@@ -59,15 +92,16 @@ class ASCEValidator:
         """Validate required ASCE packages"""
         print("\n=== Required Packages Validation ===")
         
-        required_packages = [
-            'inputenc', 'fontenc', 'babel', 'lmodern', 'graphicx',
-            'caption', 'subcaption', 'amsmath', 'siunitx', 'booktabs',
-            'array', 'multirow', 'newtxtext', 'hyperref'
-        ]
+        found = set()
+        if '\\usepackage' in content:
+            for match in PACKAGE_SCANNER.finditer(content):
+                found.add(match.group(1))
+                if len(found) == len(REQUIRED_PACKAGES):
+                    break
         
         all_found = True
-        for package in required_packages:
-            if f'\\usepackage' in content and package in content:
+        for package in REQUIRED_PACKAGES:
+            if package in found:
                 print(f"✓ Package '{package}' found")
             else:
                 print(f"✗ Package '{package}' missing")
@@ -79,17 +113,9 @@ class ASCEValidator:
         """Validate ASCE document structure"""
         print("\n=== ASCE Document Structure Validation ===")
         
-        required_sections = [
-            (r'\\begin\{abstract\}', 'Abstract environment'),
-            (r'\\section\{Practical Applications\}', 'Practical Applications section'),
-            (r'\\section\{Introduction\}', 'Introduction section'),
-            (r'\\section\{Data Availability Statement\}', 'Data Availability Statement'),
-            (r'\\KeyWords\{', 'Keywords command')
-        ]
-        
         all_found = True
-        for pattern, description in required_sections:
-            if re.search(pattern, content):
+        for pattern, description in REQUIRED_SECTIONS:
+            if pattern.search(content):
                 print(f"✓ {description} found")
             else:
                 print(f"✗ {description} missing")
@@ -119,17 +145,10 @@ class ASCEValidator:
     
     def count_elements(self, content, element_type):
         """Count specific elements in the document"""
-        if element_type == 'figures':
-            return len(re.findall(r'\\begin\{figure\}', content))
-        elif element_type == 'tables':
-            return len(re.findall(r'\\begin\{table\}', content))
-        elif element_type == 'equations':
-            return len(re.findall(r'\\begin\{equation\}', content))
-        elif element_type == 'sections':
-            return len(re.findall(r'\\section\{', content))
-        elif element_type == 'subsections':
-            return len(re.findall(r'\\subsection\{', content))
-        return 0
+        pattern = ELEMENT_PATTERNS.get(element_type)
+        if pattern is None:
+            return 0
+        return len(pattern.findall(content))
     
     def validate_content_preservation(self, asce_content, original_content):
         """Validate that content is preserved between versions"""
@@ -160,7 +179,7 @@ class ASCEValidator:
         print("\n=== Figures and Tables Validation ===")
         
         # Check figure environments
-        figures = re.findall(r'\\begin\{figure\}.*?\\end\{figure\}', content, re.DOTALL)
+        figures = FIGURE_RE.findall(content)
         print(f"Found {len(figures)} figures")
         
         for i, figure in enumerate(figures[:3]):  # Check first 3 figures
@@ -180,7 +199,7 @@ class ASCEValidator:
                 print(f"⚠ Figure {i+1}: label may not follow fig: convention")
         
         # Check table environments
-        tables = re.findall(r'\\begin\{table\}.*?\\end\{table\}', content, re.DOTALL)
+        tables = TABLE_RE.findall(content)
         print(f"Found {len(tables)} tables")
         
         for i, table in enumerate(tables[:3]):  # Check first 3 tables
@@ -200,11 +219,11 @@ class ASCEValidator:
         """Validate equation formatting"""
         print("\n=== Equations Validation ===")
         
-        equations = re.findall(r'\\begin\{equation\}.*?\\end\{equation\}', content, re.DOTALL)
+        equations = EQUATION_RE.findall(content)
         print(f"Found {len(equations)} numbered equations")
         
         # Check for equation labels
-        labeled_equations = re.findall(r'\\begin\{equation\}.*?\\label\{.*?\}.*?\\end\{equation\}', content, re.DOTALL)
+        labeled_equations = LABELED_EQUATION_RE.findall(content)
         print(f"Found {len(labeled_equations)} labeled equations")
         
         if len(equations) > 0:
@@ -217,15 +236,9 @@ class ASCEValidator:
         print("\n=== Citations Validation ===")
         
         # Count different citation types
-        cite_patterns = [
-            (r'\\cite\{[^}]+\}', 'Standard citations'),
-            (r'\\citeA\{[^}]+\}', 'Author citations'),
-            (r'\\citeN\{[^}]+\}', 'Numeric citations')
-        ]
-        
         total_citations = 0
-        for pattern, description in cite_patterns:
-            citations = re.findall(pattern, content)
+        for pattern, description in CITE_PATTERNS:
+            citations = pattern.findall(content)
             count = len(citations)
             total_citations += count
             if count > 0:
@@ -3,74 +3,22 @@
 Validate content completeness between ASCE and MDPI versions
 """
 
-import re
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-def extract_sections(tex_file):
-    """Extract all section, subsection, and subsubsection titles from a LaTeX file"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    sections = []
-    
-    # Find all section commands
-    section_pattern = r'\\(section|subsection|subsubsection)\{([^}]+)\}'
-    matches = re.finditer(section_pattern, content)
-    
-    for match in matches:
-        level = match.group(1)
-        title = match.group(2)
-        sections.append((level, title))
-    
-    return sections
+from tex_index import load_index
 
-def extract_figures(tex_file):
-    """Extract all figure labels from a LaTeX file"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    figures = []
-    
-    # Find all figure labels
-    fig_pattern = r'\\label\{fig:([^}]+)\}'
-    matches = re.finditer(fig_pattern, content)
-    
-    for match in matches:
-        figures.append(match.group(1))
-    
-    return figures
-
-def extract_tables(tex_file):
-    """Extract all table labels from a LaTeX file"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    tables = []
-    
-    # Find all table labels
-    tab_pattern = r'\\label\{tab:([^}]+)\}'
-    matches = re.finditer(tab_pattern, content)
-    
-    for match in matches:
-        tables.append(match.group(1))
-    
-    return tables
-
-def count_citations(tex_file):
-    """Count number of citations in a LaTeX file"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find all citations
-    cite_pattern = r'\\cite\{[^}]+\}'
-    citations = re.findall(cite_pattern, content)
-    
-    return len(citations)
+# Indentation of sections by depth (section, subsection, subsubsection)
+INDENT = ('', '  ', '    ')
 
 def main():
     asce_file = 'artigo_pure_classification.tex'
     mdpi_file = 'artigo_mdpi_classification.tex'
     
+    # Each file is indexed once, or loaded from the index cache while unchanged, with the two
+    # documents in separate processes; every comparison uses the resulting indexes
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        asce_index, mdpi_index = executor.map(load_index, (asce_file, mdpi_file))
+    
     print("=" * 80)
     print("CONTENT COMPLETENESS VALIDATION REPORT")
     print("=" * 80)
@@ -80,23 +28,21 @@ def main():
     print("1. SECTION STRUCTURE COMPARISON")
     print("-" * 80)
     
-    asce_sections = extract_sections(asce_file)
-    mdpi_sections = extract_sections(mdpi_file)
+    asce_sections = asce_index.sections
+    mdpi_sections = mdpi_index.sections
     
     print(f"ASCE version: {len(asce_sections)} sections")
     print(f"MDPI version: {len(mdpi_sections)} sections")
     print()
     
     print("ASCE Sections:")
-    for level, title in asce_sections:
-        indent = "  " * (0 if level == "section" else 1 if level == "subsection" else 2)
-        print(f"{indent}- {title}")
+    for depth, title in asce_sections:
+        print(f"{INDENT[depth]}- {title}")
     
     print()
     print("MDPI Sections:")
-    for level, title in mdpi_sections:
-        indent = "  " * (0 if level == "section" else 1 if level == "subsection" else 2)
-        print(f"{indent}- {title}")
+    for depth, title in mdpi_sections:
+        print(f"{INDENT[depth]}- {title}")
     
     print()
     
@@ -104,8 +50,8 @@ def main():
     print("2. FIGURE COMPARISON")
     print("-" * 80)
     
-    asce_figures = extract_figures(asce_file)
-    mdpi_figures = extract_figures(mdpi_file)
+    asce_figures = asce_index.labels['fig']
+    mdpi_figures = mdpi_index.labels['fig']
     
     print(f"ASCE version: {len(asce_figures)} figures")
     print(f"MDPI version: {len(mdpi_figures)} figures")
@@ -126,8 +72,8 @@ def main():
     print("3. TABLE COMPARISON")
     print("-" * 80)
     
-    asce_tables = extract_tables(asce_file)
-    mdpi_tables = extract_tables(mdpi_file)
+    asce_tables = asce_index.labels['tab']
+    mdpi_tables = mdpi_index.labels['tab']
     
     print(f"ASCE version: {len(asce_tables)} tables")
     print(f"MDPI version: {len(mdpi_tables)} tables")
@@ -148,8 +94,8 @@ def main():
     print("4. CITATION COMPARISON")
     print("-" * 80)
     
-    asce_citations = count_citations(asce_file)
-    mdpi_citations = count_citations(mdpi_file)
+    asce_citations = asce_index.citations
+    mdpi_citations = mdpi_index.citations
     
     print(f"ASCE version: {asce_citations} citations")
     print(f"MDPI version: {mdpi_citations} citations")
@@ -3,78 +3,38 @@
 Validate all cross-references in MDPI document
 """
 
+import mmap
 import re
-from pathlib import Path
 
-def extract_labels(tex_file):
-    """Extract all labels from a LaTeX file"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    labels = {
-        'sec': [],
-        'subsec': [],
-        'subsubsec': [],
-        'fig': [],
-        'tab': [],
-        'eq': []
-    }
-    
-    # Find all labels
-    label_pattern = r'\\label\{([^:}]+):([^}]+)\}'
-    matches = re.finditer(label_pattern, content)
-    
-    for match in matches:
-        label_type = match.group(1)
-        label_name = match.group(2)
-        
-        if label_type in labels:
-            labels[label_type].append(label_name)
-    
-    return labels
+from tex_index import load_index
 
-def extract_references(tex_file):
-    """Extract all references from a LaTeX file"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    references = {
-        'sec': [],
-        'subsec': [],
-        'subsubsec': [],
-        'fig': [],
-        'tab': [],
-        'eq': []
-    }
-    
-    # Find all references
-    ref_pattern = r'\\ref\{([^:}]+):([^}]+)\}'
-    matches = re.finditer(ref_pattern, content)
-    
-    for match in matches:
-        ref_type = match.group(1)
-        ref_name = match.group(2)
-        
-        if ref_type in references:
-            references[ref_type].append(ref_name)
-    
-    return references
+# Bytes pattern so the log can be scanned in place via mmap
+UNDEFINED_REF_RE = re.compile(rb'Reference `([^\']+)\' on page \d+ undefined')
+REFERENCE_TYPES = {
+    'sec': 'section',
+    'subsec': 'subsection',
+    'fig': 'figure',
+    'tab': 'table',
+    'eq': 'equation'
+}
+
+def resolve_references(labels, references):
+    """Return the label and reference sets of one type and the undefined references"""
+    labels = set(labels)
+    references = set(references)
+    return {'labels': labels, 'refs': references, 'undefined': references - labels}
 
 def check_undefined_references(log_file):
     """Check LaTeX log for undefined references"""
     undefined = []
     
     try:
-        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # Find undefined reference warnings
-        undefined_pattern = r'Reference `([^\']+)\' on page \d+ undefined'
-        matches = re.finditer(undefined_pattern, content)
-        
-        for match in matches:
-            undefined.append(match.group(1))
-    except FileNotFoundError:
+        # The log can be tens of MB for long runs; map it instead of reading it.
+        # Scanning the whole buffer also catches warnings TeX wrapped at 79 columns
+        with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for match in UNDEFINED_REF_RE.finditer(content):
+                undefined.append(match.group(1).decode('utf-8', errors='ignore'))
+    except (FileNotFoundError, ValueError):  # ValueError: empty log, nothing to map
         pass
     
     return undefined
@@ -89,22 +49,24 @@ def main():
     print()
     
     # Extract labels and references
-    labels = extract_labels(mdpi_file)
-    references = extract_references(mdpi_file)
+    index = load_index(mdpi_file)
+    # Each type is resolved once; the report sections and the summary share the results
+    results = {
+        kind: resolve_references(index.labels[kind], index.references[kind])
+        for kind in REFERENCE_TYPES
+    }
     
     # Validate each type
     print("1. SECTION REFERENCES")
     print("-" * 80)
     
-    sec_labels = set(labels['sec'])
-    sec_refs = set(references['sec'])
+    sec = results['sec']
     
-    print(f"Defined section labels: {len(sec_labels)}")
-    print(f"Section references: {len(sec_refs)}")
+    print(f"Defined section labels: {len(sec['labels'])}")
+    print(f"Section references: {len(sec['refs'])}")
     
-    undefined_sec = sec_refs - sec_labels
-    if undefined_sec:
-        print(f"⚠️  Undefined section references: {undefined_sec}")
+    if sec['undefined']:
+        print(f"⚠️  Undefined section references: {sec['undefined']}")
     else:
         print("✓ All section references are defined")
     print()
@@ -112,15 +74,13 @@ def main():
     print("2. SUBSECTION REFERENCES")
     print("-" * 80)
     
-    subsec_labels = set(labels['subsec'])
-    subsec_refs = set(references['subsec'])
+    subsec = results['subsec']
     
-    print(f"Defined subsection labels: {len(subsec_labels)}")
-    print(f"Subsection references: {len(subsec_refs)}")
+    print(f"Defined subsection labels: {len(subsec['labels'])}")
+    print(f"Subsection references: {len(subsec['refs'])}")
     
-    undefined_subsec = subsec_refs - subsec_labels
-    if undefined_subsec:
-        print(f"⚠️  Undefined subsection references: {undefined_subsec}")
+    if subsec['undefined']:
+        print(f"⚠️  Undefined subsection references: {subsec['undefined']}")
     else:
         print("✓ All subsection references are defined")
     print()
@@ -128,16 +88,14 @@ def main():
     print("3. FIGURE REFERENCES")
     print("-" * 80)
     
-    fig_labels = set(labels['fig'])
-    fig_refs = set(references['fig'])
+    fig = results['fig']
     
-    print(f"Defined figure labels: {len(fig_labels)}")
-    print(f"Figure references: {len(fig_refs)}")
-    print(f"Figures: {sorted(fig_labels)}")
+    print(f"Defined figure labels: {len(fig['labels'])}")
+    print(f"Figure references: {len(fig['refs'])}")
+    print(f"Figures: {sorted(fig['labels'])}")
     
-    undefined_fig = fig_refs - fig_labels
-    if undefined_fig:
-        print(f"⚠️  Undefined figure references: {undefined_fig}")
+    if fig['undefined']:
+        print(f"⚠️  Undefined figure references: {fig['undefined']}")
     else:
         print("✓ All figure references are defined")
     print()
@@ -145,16 +103,14 @@ def main():
     print("4. TABLE REFERENCES")
     print("-" * 80)
     
-    tab_labels = set(labels['tab'])
-    tab_refs = set(references['tab'])
+    tab = results['tab']
     
-    print(f"Defined table labels: {len(tab_labels)}")
-    print(f"Table references: {len(tab_refs)}")
-    print(f"Tables: {sorted(tab_labels)}")
+    print(f"Defined table labels: {len(tab['labels'])}")
+    print(f"Table references: {len(tab['refs'])}")
+    print(f"Tables: {sorted(tab['labels'])}")
     
-    undefined_tab = tab_refs - tab_labels
-    if undefined_tab:
-        print(f"⚠️  Undefined table references: {undefined_tab}")
+    if tab['undefined']:
+        print(f"⚠️  Undefined table references: {tab['undefined']}")
     else:
         print("✓ All table references are defined")
     print()
@@ -162,20 +118,18 @@ def main():
     print("5. EQUATION REFERENCES")
     print("-" * 80)
     
-    eq_labels = set(labels['eq'])
-    eq_refs = set(references['eq'])
+    eq = results['eq']
     
-    print(f"Defined equation labels: {len(eq_labels)}")
-    print(f"Equation references: {len(eq_refs)}")
+    print(f"Defined equation labels: {len(eq['labels'])}")
+    print(f"Equation references: {len(eq['refs'])}")
     
-    if eq_labels:
-        print(f"Equations: {sorted(eq_labels)}")
+    if eq['labels']:
+        print(f"Equations: {sorted(eq['labels'])}")
     
-    undefined_eq = eq_refs - eq_labels
-    if undefined_eq:
-        print(f"⚠️  Undefined equation references: {undefined_eq}")
+    if eq['undefined']:
+        print(f"⚠️  Undefined equation references: {eq['undefined']}")
     else:
-        if eq_refs:
+        if eq['refs']:
             print("✓ All equation references are defined")
         else:
             print("✓ No equation references (none expected)")
@@ -198,22 +152,11 @@ def main():
     print("7. SUMMARY")
     print("-" * 80)
     
-    issues = []
-    
-    if undefined_sec:
-        issues.append(f"Undefined section references: {len(undefined_sec)}")
-    
-    if undefined_subsec:
-        issues.append(f"Undefined subsection references: {len(undefined_subsec)}")
-    
-    if undefined_fig:
-        issues.append(f"Undefined figure references: {len(undefined_fig)}")
-    
-    if undefined_tab:
-        issues.append(f"Undefined table references: {len(undefined_tab)}")
-    
-    if undefined_eq:
-        issues.append(f"Undefined equation references: {len(undefined_eq)}")
+    issues = [
+        f"Undefined {REFERENCE_TYPES[kind]} references: {len(result['undefined'])}"
+        for kind, result in results.items()
+        if result['undefined']
+    ]
     
     if log_undefined:
         issues.append(f"LaTeX log reports {len(log_undefined)} undefined references")
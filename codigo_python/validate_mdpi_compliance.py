@@ -3,17 +3,96 @@
 Validate MDPI format compliance
 """
 
+import mmap
 import re
 from pathlib import Path
 
-def check_document_class(tex_file):
-    """Check if document class is MDPI"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+DOC_CLASS_RE = re.compile(r'\\documentclass\[([^\]]*)\]\{([^}]+)\}')
+METADATA_COMMANDS = {
+    'Title': '\\Title{',
+    'Author': '\\Author{',
+    'Address': '\\address{',
+    'Correspondence': '\\corres{',
+    'Abstract': '\\abstract{',
+    'Keywords': '\\keyword{',
+    'Author Contributions': '\\authorcontributions{',
+    'Funding': '\\funding{',
+    'Institutional Review': '\\institutionalreview{',
+    'Informed Consent': '\\informedconsent{',
+    'Data Availability': '\\dataavailability{',
+    'Conflicts of Interest': '\\conflictsofinterest{'
+}
+# All metadata commands in one alternation: a single pass over the document,
+# with the engine jumping between backslashes via its literal-prefix search
+METADATA_SCANNER = re.compile(
+    r'\\(?:%s)\{' % '|'.join(re.escape(command[1:-1]) for command in METADATA_COMMANDS.values())
+)
+BRACE_RE = re.compile(r'[{}]')
+# Abstract tokens: commands, braces, whitespace runs, and text runs
+ABSTRACT_TOKEN_RE = re.compile(r'(?P<command>\\[a-zA-Z]+)|(?P<brace>[{}])|(?P<space>\s+)|[^\s{}\\]+|\\')
+KEYWORD_RE = re.compile(r'\\keyword\{([^}]+)\}')
+BIB_STYLE_RE = re.compile(r'\\bibliographystyle\{([^}]+)\}')
+BIB_FILE_RE = re.compile(r'\\bibliography\{([^}]+)\}')
+OUTPUT_WRITTEN_RE = re.compile(rb'Output written on [^\(]+\((\d+) pages')
+
+def extract_braced(text, command):
+    """Return the argument of the first `command{...}` in text, or None
+    
+    Braces are matched with a depth counter in one linear pass, so nested
+    groups are handled and malformed input cannot trigger regex backtracking.
+    """
+    start = text.find(command)
+    if start < 0:
+        return None
+    start += len(command)
+    
+    depth = 1
+    for brace in BRACE_RE.finditer(text, start):
+        depth += 1 if brace.group() == '{' else -1
+        if depth == 0:
+            return text[start:brace.start()]
     
-    # Check for MDPI document class
-    doc_class_pattern = r'\\documentclass\[([^\]]*)\]\{([^}]+)\}'
-    match = re.search(doc_class_pattern, content)
+    return None
+
+def count_words(text):
+    """Count words in LaTeX text, ignoring commands and their braced arguments
+    
+    Tokens are consumed in one pass; a depth counter skips nested arguments
+    without building intermediate stripped strings.
+    """
+    words = 0
+    in_word = False
+    after_command = False
+    depth = 0
+    
+    for token in ABSTRACT_TOKEN_RE.finditer(text):
+        kind = token.lastgroup
+        if depth:
+            if kind == 'brace':
+                depth += 1 if token.group() == '{' else -1
+            continue
+        
+        if kind == 'command':
+            after_command = True
+            continue
+        
+        if after_command and token.group() == '{':
+            depth = 1
+        elif kind == 'space':
+            words += in_word
+            in_word = False
+        else:
+            in_word = True
+        after_command = False
+    
+    return words + in_word
+
+def check_document_class(content):
+    """Check if document class is MDPI"""
+    # Check for MDPI document class; it is in the first lines, so the regex is
+    # anchored at the first literal hit instead of searching the document
+    start = content.find('\\documentclass[')
+    match = DOC_CLASS_RE.match(content, start) if start >= 0 else None
     
     if match:
         options = match.group(1)
@@ -22,62 +101,30 @@ def check_document_class(tex_file):
     
     return None, None
 
-def check_metadata_sections(tex_file):
+def check_metadata_sections(content):
     """Check for required MDPI metadata sections"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    required_sections = {
-        'Title': r'\\Title\{',
-        'Author': r'\\Author\{',
-        'Address': r'\\address\{',
-        'Correspondence': r'\\corres\{',
-        'Abstract': r'\\abstract\{',
-        'Keywords': r'\\keyword\{',
-        'Author Contributions': r'\\authorcontributions\{',
-        'Funding': r'\\funding\{',
-        'Institutional Review': r'\\institutionalreview\{',
-        'Informed Consent': r'\\informedconsent\{',
-        'Data Availability': r'\\dataavailability\{',
-        'Conflicts of Interest': r'\\conflictsofinterest\{'
-    }
-    
-    found = {}
-    
-    for section, pattern in required_sections.items():
-        match = re.search(pattern, content)
-        found[section] = match is not None
-    
-    return found
+    present = set()
+    for match in METADATA_SCANNER.finditer(content):
+        present.add(match.group())
+        if len(present) == len(METADATA_COMMANDS):
+            break
+    
+    return {section: command in present for section, command in METADATA_COMMANDS.items()}
 
-def check_abstract_length(tex_file):
+def check_abstract_length(content):
     """Check abstract word count"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # Extract abstract content
-    abstract_pattern = r'\\abstract\{([^}]+(?:\{[^}]*\}[^}]*)*)\}'
-    match = re.search(abstract_pattern, content)
+    abstract_text = extract_braced(content, '\\abstract{')
     
-    if match:
-        abstract_text = match.group(1)
-        # Remove LaTeX commands
-        clean_text = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', '', abstract_text)
-        clean_text = re.sub(r'\\[a-zA-Z]+', '', clean_text)
-        # Count words
-        words = clean_text.split()
-        return len(words)
+    if abstract_text:
+        return count_words(abstract_text)
     
     return 0
 
-def check_keywords(tex_file):
+def check_keywords(content):
     """Check keywords format and count"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # Extract keywords
-    keyword_pattern = r'\\keyword\{([^}]+)\}'
-    match = re.search(keyword_pattern, content)
+    match = KEYWORD_RE.search(content)
     
     if match:
         keywords_text = match.group(1)
@@ -87,34 +134,32 @@ def check_keywords(tex_file):
     
     return []
 
-def check_bibliography_style(tex_file):
+def check_bibliography_style(content):
     """Check bibliography configuration"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Both commands sit at the end of the document, so each is looked up from
+    # the back and its regex anchored there
     
     # Check for bibliography style
-    bib_style_pattern = r'\\bibliographystyle\{([^}]+)\}'
-    style_match = re.search(bib_style_pattern, content)
+    start = content.rfind('\\bibliographystyle{')
+    style_match = BIB_STYLE_RE.match(content, start) if start >= 0 else None
     
     # Check for bibliography file
-    bib_file_pattern = r'\\bibliography\{([^}]+)\}'
-    file_match = re.search(bib_file_pattern, content)
+    start = content.rfind('\\bibliography{')
+    file_match = BIB_FILE_RE.match(content, start) if start >= 0 else None
     
     return style_match, file_match
 
 def get_page_count(log_file):
     """Extract page count from LaTeX log"""
     try:
-        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # Find output written line
-        output_pattern = r'Output written on [^\(]+\((\d+) pages'
-        match = re.search(output_pattern, content)
-        
-        if match:
-            return int(match.group(1))
-    except FileNotFoundError:
+        # Map the log instead of reading it and start the regex at the literal hit
+        with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            start = content.find(b'Output written on')
+            match = OUTPUT_WRITTEN_RE.search(content, start) if start >= 0 else None
+            
+            if match:
+                return int(match.group(1))
+    except (FileNotFoundError, ValueError):  # ValueError: empty log, nothing to map
         pass
     
     return None
@@ -123,6 +168,9 @@ def main():
     mdpi_file = 'artigo_mdpi_classification.tex'
     log_file = 'artigo_mdpi_classification.log'
     
+    # The manuscript is read once and shared by every check
+    content = Path(mdpi_file).read_text(encoding='utf-8')
+    
     print("=" * 80)
     print("MDPI FORMAT COMPLIANCE VALIDATION REPORT")
     print("=" * 80)
@@ -132,7 +180,7 @@ def main():
     print("1. DOCUMENT CLASS")
     print("-" * 80)
     
-    doc_class, options = check_document_class(mdpi_file)
+    doc_class, options = check_document_class(content)
     
     if doc_class:
         print(f"Document class: {doc_class}")
@@ -150,7 +198,7 @@ def main():
     print("2. REQUIRED METADATA SECTIONS")
     print("-" * 80)
     
-    metadata = check_metadata_sections(mdpi_file)
+    metadata = check_metadata_sections(content)
     
     for section, found in metadata.items():
         status = "✓" if found else "⚠️ "
@@ -168,7 +216,7 @@ def main():
     print("3. ABSTRACT")
     print("-" * 80)
     
-    abstract_words = check_abstract_length(mdpi_file)
+    abstract_words = check_abstract_length(content)
     
     print(f"Abstract word count: {abstract_words}")
     
@@ -184,7 +232,7 @@ def main():
     print("4. KEYWORDS")
     print("-" * 80)
     
-    keywords = check_keywords(mdpi_file)
+    keywords = check_keywords(content)
     
     print(f"Number of keywords: {len(keywords)}")
     print(f"Keywords: {'; '.join(keywords)}")
@@ -203,7 +251,7 @@ def main():
     print("5. BIBLIOGRAPHY")
     print("-" * 80)
     
-    style_match, file_match = check_bibliography_style(mdpi_file)
+    style_match, file_match = check_bibliography_style(content)
     
     if style_match:
         print(f"Bibliography style: {style_match.group(1)}")
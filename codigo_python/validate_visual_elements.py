@@ -3,34 +3,67 @@
 Validate all visual elements (figures and tables) in MDPI document
 """
 
+import os
 import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
-def extract_figure_info(tex_file):
+FIG_LABEL_RE = re.compile(r'\\label\{fig:([^}]+)\}')
+TAB_LABEL_RE = re.compile(r'\\label\{tab:([^}]+)\}')
+BRACE_RE = re.compile(r'[{}]')
+# Options are skipped with a negated class up to the first brace on the line,
+# which matches like the lazy '.*?' did but leaves nothing to backtrack into
+GRAPHICS_RE = re.compile(r'\\includegraphics[^{\n]*\{([^}]+)\}')
+FIG_REF_RE = re.compile(r'\\ref\{fig:([^}]+)\}')
+TAB_REF_RE = re.compile(r'\\ref\{tab:([^}]+)\}')
+
+def extract_braced(text, command):
+    """Return the brace-balanced argument of the first `command{...}`, or None"""
+    start = text.find(command)
+    if start < 0:
+        return None
+    start += len(command)
+    
+    depth = 1
+    for brace in BRACE_RE.finditer(text, start):
+        depth += 1 if brace.group() == '{' else -1
+        if depth == 0:
+            return text[start:brace.start()]
+    
+    return None
+
+def iter_environments(content, name):
+    """Yield each complete \\begin{name}...\\end{name} block using plain substring search"""
+    begin, end = f'\\begin{{{name}}}', f'\\end{{{name}}}'
+    position = 0
+    
+    while True:
+        start = content.find(begin, position)
+        if start < 0:
+            return
+        stop = content.find(end, start)
+        if stop < 0:
+            return
+        position = stop + len(end)
+        yield content[start:position]
+
+def extract_figure_info(content):
     """Extract figure labels, captions, and references"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     figures = {}
     
     # Find all figure environments
-    fig_pattern = r'\\begin\{figure\}.*?\\end\{figure\}'
-    fig_matches = re.finditer(fig_pattern, content, re.DOTALL)
-    
-    for match in fig_matches:
-        fig_content = match.group(0)
-        
+    for fig_content in iter_environments(content, 'figure'):
         # Extract label
-        label_match = re.search(r'\\label\{fig:([^}]+)\}', fig_content)
+        label_match = FIG_LABEL_RE.search(fig_content)
         if label_match:
             label = label_match.group(1)
             
             # Extract caption
-            caption_match = re.search(r'\\caption\{([^}]+(?:\{[^}]*\}[^}]*)*)\}', fig_content)
-            caption = caption_match.group(1) if caption_match else "No caption"
+            caption = extract_braced(fig_content, '\\caption{') or "No caption"
             
             # Extract includegraphics
-            graphics_match = re.search(r'\\includegraphics.*?\{([^}]+)\}', fig_content)
+            graphics_match = GRAPHICS_RE.search(fig_content)
             graphics_file = graphics_match.group(1) if graphics_match else "No file"
             
             figures[label] = {
@@ -39,67 +72,57 @@ def extract_figure_info(tex_file):
             }
     
     # Find all figure references
-    ref_pattern = r'\\ref\{fig:([^}]+)\}'
-    references = re.findall(ref_pattern, content)
+    references = FIG_REF_RE.findall(content)
     
     return figures, references
 
-def extract_table_info(tex_file):
+def extract_table_info(content):
     """Extract table labels, captions, and references"""
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     tables = {}
     
     # Find all table environments
-    tab_pattern = r'\\begin\{table\}.*?\\end\{table\}'
-    tab_matches = re.finditer(tab_pattern, content, re.DOTALL)
-    
-    for match in tab_matches:
-        tab_content = match.group(0)
-        
+    for tab_content in iter_environments(content, 'table'):
         # Extract label
-        label_match = re.search(r'\\label\{tab:([^}]+)\}', tab_content)
+        label_match = TAB_LABEL_RE.search(tab_content)
         if label_match:
             label = label_match.group(1)
             
             # Extract caption
-            caption_match = re.search(r'\\caption\{([^}]+(?:\{[^}]*\}[^}]*)*)\}', tab_content)
-            caption = caption_match.group(1) if caption_match else "No caption"
+            caption = extract_braced(tab_content, '\\caption{') or "No caption"
             
             tables[label] = {
                 'caption': caption
             }
     
     # Find all table references
-    ref_pattern = r'\\ref\{tab:([^}]+)\}'
-    references = re.findall(ref_pattern, content)
+    references = TAB_REF_RE.findall(content)
     
     return tables, references
 
+@lru_cache(maxsize=None)
+def list_directory(directory):
+    """Names in a directory, listed once per run (empty if it does not exist)"""
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
+@lru_cache(maxsize=None)
 def check_file_exists(filepath):
     """Check if a figure file exists"""
-    # Try with and without extension
+    # Try with and without extension, against one cached listing of its directory
     base_path = Path(filepath)
+    names = list_directory(str(base_path.parent))
     
-    if base_path.exists():
-        return True
-    
-    # Try with .pdf extension
-    pdf_path = base_path.with_suffix('.pdf')
-    if pdf_path.exists():
-        return True
-    
-    # Try with .png extension
-    png_path = base_path.with_suffix('.png')
-    if png_path.exists():
-        return True
-    
-    return False
+    candidates = (base_path.name, base_path.with_suffix('.pdf').name, base_path.with_suffix('.png').name)
+    return any(name in names for name in candidates)
 
 def main():
     mdpi_file = 'artigo_mdpi_classification.tex'
     
+    # The manuscript is read once and shared by both extractors
+    content = Path(mdpi_file).read_text(encoding='utf-8')
+    
     print("=" * 80)
     print("VISUAL ELEMENTS VALIDATION REPORT")
     print("=" * 80)
@@ -109,7 +132,10 @@ def main():
     print("1. FIGURE VALIDATION")
     print("-" * 80)
     
-    figures, fig_refs = extract_figure_info(mdpi_file)
+    figures, fig_refs = extract_figure_info(content)
+    fig_ref_counts = Counter(fig_refs)
+    
+    file_exists = {label: check_file_exists(info['file']) for label, info in figures.items()}
     
     print(f"Total figures defined: {len(figures)}")
     print(f"Total figure references: {len(fig_refs)}")
@@ -121,14 +147,13 @@ def main():
         print(f"  File: {info['file']}")
         
         # Check if file exists
-        file_exists = check_file_exists(info['file'])
-        if file_exists:
+        if file_exists[label]:
             print(f"  ✓ File exists")
         else:
             print(f"  ⚠️  File not found")
         
         # Check if referenced
-        ref_count = fig_refs.count(label)
+        ref_count = fig_ref_counts[label]
         if ref_count > 0:
             print(f"  ✓ Referenced {ref_count} time(s) in text")
         else:
@@ -151,7 +176,8 @@ def main():
     print("2. TABLE VALIDATION")
     print("-" * 80)
     
-    tables, tab_refs = extract_table_info(mdpi_file)
+    tables, tab_refs = extract_table_info(content)
+    tab_ref_counts = Counter(tab_refs)
     
     print(f"Total tables defined: {len(tables)}")
     print(f"Total table references: {len(tab_refs)}")
@@ -162,7 +188,7 @@ def main():
         print(f"  Caption: {info['caption'][:80]}...")
         
         # Check if referenced
-        ref_count = tab_refs.count(label)
+        ref_count = tab_ref_counts[label]
         if ref_count > 0:
             print(f"  ✓ Referenced {ref_count} time(s) in text")
         else:
@@ -188,17 +214,17 @@ def main():
     issues = []
     
     # Check for missing figure files
-    missing_files = [label for label, info in figures.items() if not check_file_exists(info['file'])]
+    missing_files = [label for label, exists in file_exists.items() if not exists]
     if missing_files:
         issues.append(f"Missing figure files: {missing_files}")
     
     # Check for unreferenced figures
-    unreferenced_figs = [label for label in figures.keys() if fig_refs.count(label) == 0]
+    unreferenced_figs = [label for label in figures if label not in fig_ref_counts]
     if unreferenced_figs:
         issues.append(f"Unreferenced figures: {unreferenced_figs}")
     
     # Check for unreferenced tables
-    unreferenced_tabs = [label for label in tables.keys() if tab_refs.count(label) == 0]
+    unreferenced_tabs = [label for label in tables if label not in tab_ref_counts]
     if unreferenced_tabs:
         issues.append(f"Unreferenced tables: {unreferenced_tabs}")
     
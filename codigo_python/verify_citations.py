@@ -5,30 +5,29 @@ Verify that all citations in text have corresponding bibliography entries.
 
 import re
 
+CITE_RE = re.compile(r'\\cite\{([^}]+)\}')
+BIB_KEY_RE = re.compile(r'@\w+\{([^,]+),')
+
 def extract_citations_from_tex(tex_file):
     """Extract all citations from the LaTeX file."""
     with open(tex_file, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    citation_pattern = r'\\cite\{([^}]+)\}'
-    matches = re.findall(citation_pattern, content)
+    if '\\cite{' not in content:
+        return set()
     
-    citations = []
-    for match in matches:
-        keys = [key.strip() for key in match.split(',')]
-        citations.extend(keys)
+    citations = set()
+    for match in CITE_RE.finditer(content):
+        citations.update(key.strip() for key in match.group(1).split(','))
     
-    return set(citations)
+    return citations
 
 def extract_references_from_bib(bib_file):
     """Extract all reference keys from the bibliography file."""
     with open(bib_file, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    ref_pattern = r'@\w+\{([^,]+),'
-    references = re.findall(ref_pattern, content)
-    
-    return set(references)
+    return {match.group(1) for match in BIB_KEY_RE.finditer(content)}
 
 def main():
     tex_file = 'artigo_classificacao_corrosao.tex'
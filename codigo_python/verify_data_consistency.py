@@ -3,25 +3,51 @@ Verify All Numerical Data Consistency
 Cross-checks accuracy values in text, tables, and figures
 """
 
+import mmap
 import re
 import os
+from collections import Counter
+from contextlib import contextmanager
+
+import numpy as np
+
+# Patterns are bytes so the article can be scanned in place via mmap
+ACCURACY_RE = re.compile(rb'(\d+\.\d+)%')
+TABLE2_RE = re.compile(rb'\\caption\{Validation Performance Metrics.*?\\end\{tabularx\}', re.DOTALL)
+TABLE2_MODELS = ('ResNet50', 'EfficientNet-B0', 'Custom CNN')
+# All three rows in one pass; the value sits in a lookahead so a model named
+# before another on the same line does not hide the second one
+TABLE2_ROW_RE = re.compile(
+    rb'(?P<model>%s)(?=.*?(?P<acc>\d+\.\d+)%%)' % b'|'.join(re.escape(model.encode('ascii')) for model in TABLE2_MODELS)
+)
+# Key phrases to check in the running text
+TEXT_CHECKS = [
+    (re.compile(rb'ResNet50 achieved.*?(\d+\.\d+)%.*?validation accuracy', re.IGNORECASE), 'ResNet50 validation accuracy'),
+    (re.compile(rb'EfficientNet-B0.*?(\d+\.\d+)%.*?accuracy', re.IGNORECASE), 'EfficientNet-B0 accuracy'),
+    (re.compile(rb'Custom CNN achieved.*?(\d+\.\d+)%.*?validation accuracy', re.IGNORECASE), 'Custom CNN validation accuracy'),
+]
+
+@contextmanager
+def map_file(file_path):
+    """Memory-map a file read-only; an empty file (which mmap rejects) yields b''"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                yield content
 
 def extract_accuracy_values_from_tex(tex_file):
     """Extract all accuracy values mentioned in the LaTeX file"""
     
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # Find all accuracy percentages
-    accuracy_pattern = r'(\d+\.\d+)%'
-    matches = re.findall(accuracy_pattern, content)
+    with map_file(tex_file) as content:
+        matches = ACCURACY_RE.findall(content)
     
-    # Convert to floats and count occurrences
-    accuracy_values = {}
-    for match in matches:
-        val = float(match)
-        if val > 50 and val < 100:  # Filter for reasonable accuracy values
-            accuracy_values[val] = accuracy_values.get(val, 0) + 1
+    # Convert to floats in one pass and count occurrences
+    values = np.fromiter(matches, dtype=np.float64, count=len(matches))
+    values = values[(values > 50) & (values < 100)]  # Filter for reasonable accuracy values
+    accuracy_values = Counter(values.tolist())
     
     return accuracy_values
 
@@ -62,39 +88,34 @@ def check_confusion_matrix_consistency():
     print()
     return all_match
 
-def check_table_consistency(tex_file):
+def check_table_consistency(content):
     """Check that tables contain consistent accuracy values"""
     
     print("Checking table consistency...")
     print()
     
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # Find Table 2 (Performance Metrics)
-    table2_pattern = r'\\caption\{Validation Performance Metrics.*?\\end\{tabularx\}'
-    table2_match = re.search(table2_pattern, content, re.DOTALL)
+    table2_match = TABLE2_RE.search(content)
     
     if table2_match:
+        # Only the table itself is copied out of the document
         table2_content = table2_match.group(0)
         
-        # Extract accuracy values from table
-        resnet_match = re.search(r'ResNet50.*?(\d+\.\d+)%', table2_content)
-        efficient_match = re.search(r'EfficientNet-B0.*?(\d+\.\d+)%', table2_content)
-        custom_match = re.search(r'Custom CNN.*?(\d+\.\d+)%', table2_content)
+        # Extract accuracy values from table, keeping the first value of each model
+        rows = {}
+        for match in TABLE2_ROW_RE.finditer(table2_content):
+            rows.setdefault(match.group('model').decode('ascii'), match.group('acc').decode('ascii'))
         
-        if resnet_match and efficient_match and custom_match:
+        if len(rows) == len(TABLE2_MODELS):
             print(f"  Table 2 (Performance Metrics):")
-            print(f"    ResNet50:        {resnet_match.group(1)}%")
-            print(f"    EfficientNet-B0: {efficient_match.group(1)}%")
-            print(f"    Custom CNN:      {custom_match.group(1)}%")
+            print(f"    ResNet50:        {rows['ResNet50']}%")
+            print(f"    EfficientNet-B0: {rows['EfficientNet-B0']}%")
+            print(f"    Custom CNN:      {rows['Custom CNN']}%")
             print()
             
             # Check if they match expected values
             expected = [94.2, 91.9, 85.5]
-            actual = [float(resnet_match.group(1)), 
-                     float(efficient_match.group(1)), 
-                     float(custom_match.group(1))]
+            actual = [float(rows[model]) for model in TABLE2_MODELS]
             
             if actual == expected:
                 print("  ✓ Table 2 values match expected accuracies")
@@ -109,24 +130,14 @@ def check_table_consistency(tex_file):
     
     print()
 
-def check_text_consistency(tex_file):
+def check_text_consistency(content):
     """Check that text mentions consistent accuracy values"""
     
     print("Checking text consistency...")
     print()
     
-    with open(tex_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Key phrases to check
-    checks = [
-        (r'ResNet50 achieved.*?(\d+\.\d+)%.*?validation accuracy', 'ResNet50 validation accuracy'),
-        (r'EfficientNet-B0.*?(\d+\.\d+)%.*?accuracy', 'EfficientNet-B0 accuracy'),
-        (r'Custom CNN achieved.*?(\d+\.\d+)%.*?validation accuracy', 'Custom CNN validation accuracy'),
-    ]
-    
-    for pattern, description in checks:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern, description in TEXT_CHECKS:
+        match = pattern.search(content)
         if match:
             value = float(match.group(1))
             print(f"  {description:40s}: {value}%")
@@ -175,8 +186,12 @@ def main():
     
     # Run all consistency checks
     cm_consistent = check_confusion_matrix_consistency()
-    check_table_consistency(tex_file)
-    check_text_consistency(tex_file)
+    # Map the article once; the table and text checks scan the same buffer.
+    # They run sequentially on purpose: re holds the GIL, so threads cannot
+    # overlap the scans, and a process pool costs more than the ~1 ms they take
+    with map_file(tex_file) as content:
+        check_table_consistency(content)
+        check_text_consistency(content)
     check_training_validation_splits()
     
     # Summary
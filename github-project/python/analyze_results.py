@@ -8,8 +8,11 @@ Date: 2025-11-10
 
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Figures are only saved to files; skip GUI backend setup
 import matplotlib.pyplot as plt
 import seaborn as sns
+from functools import lru_cache
 from pathlib import Path
 import scipy.io as sio
 
@@ -18,15 +21,21 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 11
 
+@lru_cache(maxsize=None)
 def load_matlab_results(model_name):
-    """Load results from MATLAB .mat file"""
+    """Load results from MATLAB .mat file
+    
+    Cached per model: every analysis step reads the same results, so each
+    file is parsed once per run. Callers must not mutate the returned dict.
+    """
     results_path = Path('../results') / f'{model_name}_test_results.mat'
     
     if not results_path.exists():
         print(f"Warning: Results file not found for {model_name}")
         return None
     
-    mat_data = sio.loadmat(str(results_path))
+    # Only the `results` struct is decoded, whatever else the file holds
+    mat_data = sio.loadmat(str(results_path), variable_names=('results',))
     results = mat_data['results'][0, 0]
     
     return {
@@ -57,20 +66,23 @@ def compare_models():
             print(f"\nSkipping {model} - results not found")
             continue
     
-    # Create comparison dataframe
-    comparison_data = []
-    for model_name, res in results.items():
-        if res is not None:
-            comparison_data.append({
-                'Model': model_name.replace('_', ' ').title(),
-                'Accuracy (%)': res['accuracy'],
-                'CI Lower (%)': res['ci_lower'],
-                'CI Upper (%)': res['ci_upper'],
-                'Inference Time (ms)': res['time_per_image'],
-                'Throughput (img/s)': 1000 / res['time_per_image']
-            })
+    # Collect each metric into an array once; the table and the plots share them
+    loaded = [res for res in results.values() if res is not None]
+    models_list = [res['model_name'].replace('_', ' ').title() for res in loaded]
+    accuracies, ci_lower, ci_upper, times = (
+        np.fromiter((res[key] for res in loaded), dtype=np.float64, count=len(loaded))
+        for key in ('accuracy', 'ci_lower', 'ci_upper', 'time_per_image')
+    )
     
-    df = pd.DataFrame(comparison_data)
+    # Create comparison dataframe
+    df = pd.DataFrame({
+        'Model': models_list,
+        'Accuracy (%)': accuracies,
+        'CI Lower (%)': ci_lower,
+        'CI Upper (%)': ci_upper,
+        'Inference Time (ms)': times,
+        'Throughput (img/s)': 1000 / times
+    })
     
     print("\n" + "="*80)
     print("PERFORMANCE COMPARISON")
@@ -82,14 +94,8 @@ def compare_models():
     
     # Accuracy comparison
     ax1 = axes[0]
-    models_list = df['Model'].tolist()
-    accuracies = df['Accuracy (%)'].tolist()
-    ci_lower = df['CI Lower (%)'].tolist()
-    ci_upper = df['CI Upper (%)'].tolist()
-    
     x_pos = np.arange(len(models_list))
-    errors = [[acc - low for acc, low in zip(accuracies, ci_lower)],
-              [up - acc for acc, up in zip(accuracies, ci_upper)]]
+    errors = np.vstack([accuracies - ci_lower, ci_upper - accuracies])
     
     ax1.bar(x_pos, accuracies, yerr=errors, capsize=5, 
             color=['#1f77b4', '#ff7f0e', '#2ca02c'], alpha=0.8)
@@ -107,8 +113,6 @@ def compare_models():
     
     # Inference time comparison
     ax2 = axes[1]
-    times = df['Inference Time (ms)'].tolist()
-    
     ax2.bar(x_pos, times, color=['#1f77b4', '#ff7f0e', '#2ca02c'], alpha=0.8)
     ax2.set_xlabel('Model')
     ax2.set_ylabel('Inference Time (ms)')
@@ -123,6 +127,7 @@ def compare_models():
     
     plt.tight_layout()
     plt.savefig('../results/model_comparison.png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
     print(f"\n✓ Comparison plot saved to: ../results/model_comparison.png")
     
     # Save comparison table
@@ -144,20 +149,23 @@ def plot_per_class_metrics():
     metrics = ['precision', 'recall', 'f1score']
     titles = ['Precision', 'Recall', 'F1-Score']
     
+    # Load every model once, outside the per-metric loop; the bar offset keeps
+    # each model's position even when another model's results are missing
+    loaded = [(i, model, load_matlab_results(model)) for i, model in enumerate(models)]
+    loaded = [(i, model, results) for i, model, results in loaded if results is not None]
+    
     for idx, (metric, title) in enumerate(zip(metrics, titles)):
         ax = axes[idx]
         
         x = np.arange(len(class_names))
         width = 0.25
         
-        for i, model in enumerate(models):
-            results = load_matlab_results(model)
-            if results is not None:
-                values = results[metric] * 100  # Convert to percentage
-                offset = (i - 1) * width
-                ax.bar(x + offset, values, width, 
-                      label=model.replace('_', ' ').title(),
-                      alpha=0.8)
+        for i, model, results in loaded:
+            values = results[metric] * 100  # Convert to percentage
+            offset = (i - 1) * width
+            ax.bar(x + offset, values, width, 
+                  label=model.replace('_', ' ').title(),
+                  alpha=0.8)
         
         ax.set_xlabel('Class')
         ax.set_ylabel(f'{title} (%)')
@@ -170,6 +178,7 @@ def plot_per_class_metrics():
     
     plt.tight_layout()
     plt.savefig('../results/per_class_metrics.png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
     print(f"✓ Per-class metrics plot saved to: ../results/per_class_metrics.png")
 
 def analyze_confusion_patterns():
@@ -194,10 +203,11 @@ def analyze_confusion_patterns():
         print("\nNormalized (by row):")
         print(cm_norm)
         
-        # Check for adjacent-class errors
+        # Check for adjacent-class errors: the two diagonals next to the main one;
+        # every other off-diagonal cell skips at least one severity level
         total_errors = cm.sum() - np.trace(cm)
-        adjacent_errors = cm[0, 1] + cm[1, 0] + cm[1, 2] + cm[2, 1]
-        critical_errors = cm[0, 2] + cm[2, 0]
+        adjacent_errors = np.trace(cm, offset=1) + np.trace(cm, offset=-1)
+        critical_errors = total_errors - adjacent_errors
         
         print(f"\nError Analysis:")
         print(f"  Total errors: {total_errors}")
@@ -258,4 +268,3 @@ def generate_summary_report():
 
 if __name__ == '__main__':
     generate_summary_report()
-    plt.show()
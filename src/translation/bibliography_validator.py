@@ -4,23 +4,59 @@ Bibliography Validation Script for English Translation
 Validates bibliography consistency and citation format for the translated article.
 """
 
+import mmap
+import os
 import re
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
+# Patterns are bytes so the sources can be scanned in place via mmap
+BIB_ENTRY_RE = re.compile(rb'@(?:article|inproceedings|book|misc|manual)\s*\{\s*([^,\s]+)', re.IGNORECASE)
+CITE_RE = re.compile(rb'\\cite\s*\{\s*([^}]+)\s*\}')
+PORTUGUESE_HEADERS = [
+    'SEÇÃO',
+    'REFERÊNCIAS',
+    'NORMAS E PADRÕES',
+    'DETECÇÃO DE CORROSÃO',
+    'MECANISMOS DE ATENÇÃO'
+]
+PUBLISHERS = [b'MIT Press', b'Springer', b'Wiley', b'McGraw-Hill']
+# Line checks in one scan: a zero-width match at the start of every line that opens
+# an @article entry or names a publisher in a journal line. Lines that need no
+# Python-side check never become candidates
+CANDIDATE_LINE_RE = re.compile(
+    rb'^(?=(?i:@article)|(?=[^\n]*journal)[^\n]*(?:%s))' % b'|'.join(map(re.escape, PUBLISHERS)),
+    re.MULTILINE
+)
+# The (up to) nine lines following an @article line, matched in one call
+NEXT_LINES_RE = re.compile(rb'(?:[^\n]*\n){0,8}[^\n]*')
+
+@contextmanager
+def map_file(file_path):
+    """Memory-map a file read-only; an empty file (which mmap rejects) yields b''."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                yield content
+
+def count_newlines(buffer, start, end, chunk_size=1 << 16):
+    """Count newlines in buffer[start:end], copying at most chunk_size bytes at a time."""
+    count = 0
+    for chunk_start in range(start, end, chunk_size):
+        count += buffer[chunk_start:min(chunk_start + chunk_size, end)].count(b'\n')
+    return count
+
 def extract_bib_keys(bib_file_path):
     """Extract all bibliography keys from the .bib file."""
     bib_keys = set()
     
-    with open(bib_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find all @article, @inproceedings, @book, @misc entries
-    pattern = r'@(?:article|inproceedings|book|misc|manual)\s*\{\s*([^,\s]+)'
-    matches = re.findall(pattern, content, re.IGNORECASE)
-    
-    for match in matches:
-        bib_keys.add(match.strip())
+    # Find all @article, @inproceedings, @book, @misc entries, decoding only the keys
+    with map_file(bib_file_path) as content:
+        for match in BIB_ENTRY_RE.finditer(content):
+            bib_keys.add(match.group(1).decode('utf-8').strip())
     
     return bib_keys
 
@@ -28,54 +64,45 @@ def extract_citations(tex_file_path):
     """Extract all citations from the .tex file."""
     citations = set()
     
-    with open(tex_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # Find all \cite{...} commands
-    pattern = r'\\cite\s*\{\s*([^}]+)\s*\}'
-    matches = re.findall(pattern, content)
-    
-    for match in matches:
-        # Split multiple citations separated by commas
-        cite_keys = [key.strip() for key in match.split(',')]
-        citations.update(cite_keys)
+    with map_file(tex_file_path) as content:
+        for match in CITE_RE.finditer(content):
+            # Split multiple citations separated by commas
+            cite_keys = [key.strip() for key in match.group(1).decode('utf-8').split(',')]
+            citations.update(cite_keys)
     
     return citations
 
 def validate_bibliography_format(bib_file_path):
     """Validate bibliography format and consistency."""
     issues = []
-    
-    with open(bib_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Check for Portuguese section headers
-    portuguese_patterns = [
-        r'SEÇÃO',
-        r'REFERÊNCIAS',
-        r'NORMAS E PADRÕES',
-        r'DETECÇÃO DE CORROSÃO',
-        r'MECANISMOS DE ATENÇÃO'
-    ]
-    
-    for pattern in portuguese_patterns:
-        if re.search(pattern, content):
-            issues.append(f"Portuguese text found: {pattern}")
-    
-    # Check for inconsistent entry types
-    lines = content.split('\n')
-    for i, line in enumerate(lines):
-        # Check for @article entries with booktitle
-        if re.match(r'@article', line, re.IGNORECASE):
-            # Look ahead for booktitle in the next few lines
-            for j in range(i+1, min(i+10, len(lines))):
-                if 'booktitle' in lines[j]:
-                    issues.append(f"Line {i+1}: @article entry has booktitle (should be @inproceedings)")
-                    break
+    line_number = 1
+    last = 0
+    
+    with map_file(bib_file_path) as content:
+        # Check for Portuguese section headers: fixed strings, so a plain find
+        # (which stops at the first hit) beats a regex alternation
+        for header in PORTUGUESE_HEADERS:
+            if content.find(header.encode('utf-8')) >= 0:
+                issues.append(f"Portuguese text found: {header}")
         
-        # Check for journal entries that should be publishers
-        if 'journal' in line and any(pub in line for pub in ['MIT Press', 'Springer', 'Wiley', 'McGraw-Hill']):
-            issues.append(f"Line {i+1}: Publisher in journal field")
+        for match in CANDIDATE_LINE_RE.finditer(content):
+            # Candidate line: count newlines since the previous one in bounded chunks,
+            # so memory stays flat however far apart the candidates are
+            start = match.start()
+            line_number += count_newlines(content, last, start)
+            last = start
+            end = content.find(b'\n', start)
+            line = content[start:end] if end >= 0 else content[start:]
+            
+            # Check for @article entries with booktitle in the next few lines
+            if line[:8].lower() == b'@article' and end >= 0:
+                if b'booktitle' in NEXT_LINES_RE.match(content, end + 1).group():
+                    issues.append(f"Line {line_number}: @article entry has booktitle (should be @inproceedings)")
+            
+            # Check for journal entries that should be publishers
+            if b'journal' in line and any(pub in line for pub in PUBLISHERS):
+                issues.append(f"Line {line_number}: Publisher in journal field")
     
     return issues
 
@@ -121,16 +148,19 @@ def main():
     print("\n2. Citation Consistency Validation:")
     missing_refs, unused_refs = validate_citation_consistency(tex_file, bib_file)
     
+    # The two sets are disjoint: sort them once together, then split by membership
+    ordered_refs = sorted(missing_refs | unused_refs)
+    
     if missing_refs:
         print("   Missing bibliography entries:")
-        for ref in sorted(missing_refs):
+        for ref in (ref for ref in ordered_refs if ref in missing_refs):
             print(f"   - {ref}")
     else:
         print("   ✓ All citations have corresponding bibliography entries")
     
     if unused_refs:
         print("   Unused bibliography entries:")
-        for ref in sorted(unused_refs):
+        for ref in (ref for ref in ordered_refs if ref in unused_refs):
             print(f"   - {ref}")
     else:
         print("   ✓ All bibliography entries are cited")
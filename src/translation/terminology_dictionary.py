@@ -4,252 +4,485 @@ Terminology Dictionary for Portuguese-English Technical Translation
 Provides consistent technical translations for scientific article content.
 """
 
+import re
+from functools import lru_cache, partial
+from types import MappingProxyType
+
+# Keys are lower-case: lookups lower-case the query and match them directly
+TERMINOLOGY_MAP = {
+    'structural_engineering': {
+        # Steel and Materials
+        'aço astm a572 grau 50': 'ASTM A572 Grade 50 steel',
+        'vigas w': 'W-beams',
+        'vigas de aço': 'steel beams',
+        'estruturas metálicas': 'metal structures',
+        'elementos estruturais': 'structural elements',
+        'integridade estrutural': 'structural integrity',
+        'segurança estrutural': 'structural safety',
+        'inspeção estrutural': 'structural inspection',
+        'monitoramento estrutural': 'structural monitoring',
+        'patologia estrutural': 'structural pathology',
+        
+        # Corrosion Terms
+        'corrosão': 'corrosion',
+        'corrosão atmosférica': 'atmospheric corrosion',
+        'corrosão uniforme': 'uniform corrosion',
+        'corrosão por pites': 'pitting corrosion',
+        'corrosão galvânica': 'galvanic corrosion',
+        'produtos de corrosão': 'corrosion products',
+        'processos corrosivos': 'corrosive processes',
+        'deterioração': 'deterioration',
+        'oxidação': 'oxidation',
+        'ferrugem': 'rust',
+        
+        # Inspection and Testing
+        'inspeção visual': 'visual inspection',
+        'ensaios não destrutivos': 'non-destructive testing',
+        'detecção automatizada': 'automated detection',
+        'monitoramento': 'monitoring',
+        'avaliação': 'assessment',
+        'diagnóstico': 'diagnosis',
+        
+        # Properties and Characteristics
+        'propriedades mecânicas': 'mechanical properties',
+        'tensão de escoamento': 'yield strength',
+        'tensão de ruptura': 'tensile strength',
+        'resistência': 'strength',
+        'ductilidade': 'ductility',
+        'soldabilidade': 'weldability',
+        'composição química': 'chemical composition',
+        'microestrutura': 'microstructure'
+    },
+    
+    'deep_learning': {
+        # Neural Networks
+        'redes neurais convolucionais': 'convolutional neural networks',
+        'redes neurais profundas': 'deep neural networks',
+        'aprendizado profundo': 'deep learning',
+        'inteligência artificial': 'artificial intelligence',
+        'visão computacional': 'computer vision',
+        'processamento de imagens': 'image processing',
+        
+        # Architectures
+        'u-net': 'U-Net',
+        'attention u-net': 'Attention U-Net',
+        'arquitetura': 'architecture',
+        'encoder': 'encoder',
+        'decoder': 'decoder',
+        'bottleneck': 'bottleneck',
+        'skip connections': 'skip connections',
+        'attention gates': 'attention gates',
+        'mecanismos de atenção': 'attention mechanisms',
+        
+        # Training and Optimization
+        'treinamento': 'training',
+        'otimização': 'optimization',
+        'otimizador': 'optimizer',
+        'função de perda': 'loss function',
+        'taxa de aprendizado': 'learning rate',
+        'hiperparâmetros': 'hyperparameters',
+        'épocas': 'epochs',
+        'batch size': 'batch size',
+        'validação cruzada': 'cross-validation',
+        'early stopping': 'early stopping',
+        'overfitting': 'overfitting',
+        'regularização': 'regularization',
+        'dropout': 'dropout',
+        
+        # Data Processing
+        'pré-processamento': 'preprocessing',
+        'augmentação de dados': 'data augmentation',
+        'normalização': 'normalization',
+        'redimensionamento': 'resizing',
+        'dataset': 'dataset',
+        'conjunto de dados': 'dataset',
+        'anotação manual': 'manual annotation',
+        'máscaras binárias': 'binary masks',
+        'ground truth': 'ground truth'
+    },
+    
+    'segmentation_metrics': {
+        # Evaluation Metrics
+        'segmentação semântica': 'semantic segmentation',
+        'intersection over union': 'Intersection over Union (IoU)',
+        'iou': 'IoU',
+        'coeficiente dice': 'Dice coefficient',
+        'dice': 'Dice coefficient',
+        'precisão': 'precision',
+        'revocação': 'recall',
+        'recall': 'recall',
+        'f1-score': 'F1-Score',
+        'acurácia': 'accuracy',
+        'especificidade': 'specificity',
+        'sensibilidade': 'sensitivity',
+        
+        # Statistical Terms
+        'verdadeiros positivos': 'true positives',
+        'falsos positivos': 'false positives',
+        'verdadeiros negativos': 'true negatives',
+        'falsos negativos': 'false negatives',
+        'matriz de confusão': 'confusion matrix',
+        'curva roc': 'ROC curve',
+        'área sob a curva': 'area under the curve',
+        'auc': 'AUC'
+    },
+    
+    'statistics': {
+        # Statistical Analysis
+        'análise estatística': 'statistical analysis',
+        'teste t de student': "Student's t-test",
+        'teste de significância': 'significance test',
+        'intervalo de confiança': 'confidence interval',
+        'nível de significância': 'significance level',
+        'valor p': 'p-value',
+        'hipótese nula': 'null hypothesis',
+        'hipótese alternativa': 'alternative hypothesis',
+        'média': 'mean',
+        'desvio padrão': 'standard deviation',
+        'mediana': 'median',
+        'quartis': 'quartiles',
+        'distribuição normal': 'normal distribution',
+        'correlação': 'correlation',
+        'regressão': 'regression'
+    },
+    
+    'academic_writing': {
+        # Document Structure
+        'resumo': 'abstract',
+        'palavras-chave': 'keywords',
+        'introdução': 'introduction',
+        'revisão da literatura': 'literature review',
+        'metodologia': 'methodology',
+        'resultados': 'results',
+        'discussão': 'discussion',
+        'conclusões': 'conclusions',
+        'referências': 'references',
+        'bibliografia': 'bibliography',
+        
+        # Academic Terms
+        'objetivo geral': 'general objective',
+        'objetivos específicos': 'specific objectives',
+        'justificativa': 'rationale',
+        'relevância científica': 'scientific relevance',
+        'contribuição': 'contribution',
+        'limitações': 'limitations',
+        'trabalhos futuros': 'future work',
+        'estado da arte': 'state of the art',
+        'lacuna de conhecimento': 'knowledge gap',
+        
+        # Research Terms
+        'pesquisa': 'research',
+        'estudo': 'study',
+        'investigação': 'investigation',
+        'experimento': 'experiment',
+        'protocolo experimental': 'experimental protocol',
+        'procedimento': 'procedure',
+        'método': 'method',
+        'abordagem': 'approach',
+        'técnica': 'technique',
+        'ferramenta': 'tool'
+    },
+    
+    'figures_tables': {
+        # Figure References
+        'figura': 'Figure',
+        'tabela': 'Table',
+        'gráfico': 'Graph',
+        'diagrama': 'Diagram',
+        'fluxograma': 'Flowchart',
+        'esquema': 'Scheme',
+        
+        # Figure Descriptions
+        'arquitetura da rede': 'network architecture',
+        'fluxograma da metodologia': 'methodology flowchart',
+        'comparação de segmentações': 'segmentation comparison',
+        'gráficos de performance': 'performance graphs',
+        'curvas de aprendizado': 'learning curves',
+        'mapas de atenção': 'attention maps',
+        'características do dataset': 'dataset characteristics',
+        'configurações de treinamento': 'training configurations',
+        'resultados quantitativos': 'quantitative results',
+        'análise computacional': 'computational analysis'
+    }
+}
+
+# Abbreviations and acronyms
+ABBREVIATIONS = {
+    'CNN': 'CNN',
+    'GPU': 'GPU',
+    'CPU': 'CPU',
+    'RAM': 'RAM',
+    'RGB': 'RGB',
+    'JPEG': 'JPEG',
+    'TIFF': 'TIFF',
+    'PDF': 'PDF',
+    'LaTeX': 'LaTeX',
+    'ASTM': 'ASTM',
+    'ISO': 'ISO',
+    'AISC': 'AISC',
+    'MPa': 'MPa',
+    'ksi': 'ksi',
+    'mm': 'mm',
+    'cm': 'cm',
+    'kg': 'kg',
+    'CUDA': 'CUDA',
+    'cuDNN': 'cuDNN'
+}
+
+# Units and measurements
+UNITS = {
+    'pixels': 'pixels',
+    'megapixels': 'megapixels',
+    'bits': 'bits',
+    'bytes': 'bytes',
+    'MB': 'MB',
+    'GB': 'GB',
+    'Hz': 'Hz',
+    'MHz': 'MHz',
+    'GHz': 'GHz',
+    'segundos': 'seconds',
+    'minutos': 'minutes',
+    'horas': 'hours',
+    'graus': 'degrees',
+    '°C': '°C',
+    '%': '%'
+}
+
+# The shared tables are read-only; an instance copies them only when a term is added
+TERMINOLOGY_MAP = MappingProxyType({
+    domain: MappingProxyType(domain_dict) for domain, domain_dict in TERMINOLOGY_MAP.items()
+})
+ABBREVIATIONS = MappingProxyType(ABBREVIATIONS)
+UNITS = MappingProxyType(UNITS)
+# Returned for unknown domains, so a miss allocates nothing either
+_EMPTY_TERMS = MappingProxyType({})
+
+# Portuguese fragments that should not survive translation; no entry
+# contains another, so each one is a separate check
+PORTUGUESE_INDICATORS = (
+    'ção', 'são', 'ões', 'mente', 'dade', 'agem',
+    'treinamento', 'aprendizado'
+)
+# The only ones that can occur in pure-ASCII text
+PORTUGUESE_ASCII_INDICATORS = tuple(indicator for indicator in PORTUGUESE_INDICATORS if indicator.isascii())
+# Reported on their own, but only looked for once 'ção' has matched
+PORTUGUESE_CAO_WORDS = ('segmentação', 'detecção')
+
+def _build_lookup_tables(terminology_map, abbreviations, units):
+    """
+    Build the lookup tables used for translation.
+    
+    The flat map merges every domain, then abbreviations, then units; the
+    first source that defines a term wins, matching the search order. Domain
+    keys are already lower-case; abbreviations and units keep their display
+    case and are lower-cased here.
+    
+    Returns:
+        tuple: (flat map, domain overrides, whole-text pattern)
+    """
+    # Repeated translations ('dataset', 'Dice coefficient', ...) already share
+    # one object: equal string constants in this module are folded at compile
+    # time, so interning the values would change nothing
+    flat_map = {}
+    for domain_dict in terminology_map.values():
+        for term, translation in domain_dict.items():
+            flat_map.setdefault(term, translation)
+    for table in (abbreviations, units):
+        for term, translation in table.items():
+            flat_map.setdefault(term.lower(), translation)
+    
+    # A domain lookup only differs from the flat one for terms that domain
+    # translates differently; keyed by (domain, term), and usually empty
+    domain_overrides = {
+        (domain, term): translation
+        for domain, domain_dict in terminology_map.items()
+        for term, translation in domain_dict.items()
+        if flat_map[term] != translation
+    }
+    
+    # Lookarounds keep matches to whole words
+    term_pattern = re.compile(r'(?<!\w)%s(?!\w)' % trie_pattern(flat_map), re.IGNORECASE)
+    
+    return flat_map, domain_overrides, term_pattern
+
+def trie_pattern(terms):
+    """
+    Return a regex source matching any of the given terms.
+    
+    Terms with shared prefixes ('corrosão', 'corrosão uniforme', ...) are
+    factored into a prefix tree, so at each position the engine follows one
+    branch per character instead of trying every term in turn. Where terms
+    overlap, the longest one is tried first.
+    
+    Args:
+        terms (iterable): Literal terms to match
+        
+    Returns:
+        str: Pattern source, without boundaries or flags
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return _trie_regex(trie)
+
+def _trie_regex(node):
+    """
+    Return a regex matching the terms stored in a prefix-tree node.
+    
+    Continuations are optional and greedy, so the longest term wins; sibling
+    branches start with different characters, so at most one can match. The
+    terms therefore need no longest-first sort, and insertion order keeps the
+    generated pattern deterministic.
+    """
+    branches = [re.escape(char) + _trie_regex(child) for char, child in node.items() if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:%s)' % '|'.join(branches)
+    # A term ends at this node: the longer terms below it are optional
+    return '(?:%s)?' % body if '' in node else body
+
+@lru_cache(maxsize=None)
+def _shared_lookup_tables():
+    """
+    Build the lookup tables for the shared module tables on first use.
+    
+    Callers that only read the domain tables (as TerminologyValidator does)
+    never pay for the flat map and the compiled pattern.
+    """
+    return _build_lookup_tables(TERMINOLOGY_MAP, ABBREVIATIONS, UNITS)
+
+@lru_cache(maxsize=4096)
+def get_translation(term, domain=None):
+    """
+    Get English translation for a Portuguese term.
+    
+    Cached per (term, domain): the module tables never change, and documents
+    repeat the same terms many times.
+    
+    Args:
+        term (str): Portuguese term to translate
+        domain (str, optional): Specific domain to search in
+        
+    Returns:
+        str: English translation or original term if not found
+    """
+    flat_map, domain_overrides, _ = _shared_lookup_tables()
+    term_lower = term.lower()
+    
+    if domain_overrides and domain is not None:
+        translation = domain_overrides.get((domain, term_lower))
+        if translation is not None:
+            return translation
+    
+    # One lookup across all domains, abbreviations and units; return the
+    # original term if no translation is found. Abbreviations and units are
+    # keyed lower-case like every other term, so no classifying step is
+    # needed, and a hit returns their canonical case ('cnn' -> 'CNN')
+    return flat_map.get(term_lower, term)
+
+def translate_text(text):
+    """
+    Translate every known term in a text in a single pass.
+    
+    Matching is case-insensitive and limited to whole words; where terms
+    overlap, the longest one wins.
+    
+    Args:
+        text (str): Portuguese text to translate
+        
+    Returns:
+        str: Text with every known term replaced by its English translation
+    """
+    flat_map, _, term_pattern = _shared_lookup_tables()
+    # str.translate maps single characters only, so multi-word terms go
+    # through one substitution pass with the compiled alternation instead
+    return term_pattern.sub(partial(_replace_term, flat_map), text)
+
+def _replace_term(flat_map, match):
+    """Return the translation of a term matched by translate_text."""
+    term = match.group()
+    return flat_map.get(term.lower(), term)
+
+def get_all_terms_by_domain(domain):
+    """
+    Get all terms for a specific domain.
+    
+    Args:
+        domain (str): Domain name
+        
+    Returns:
+        dict: Read-only mapping of Portuguese-English term pairs
+    """
+    return TERMINOLOGY_MAP.get(domain, _EMPTY_TERMS)
+
+def validate_consistency(text):
+    """
+    Check for terminology consistency in translated text.
+    
+    Args:
+        text (str): Text to validate
+        
+    Returns:
+        list: List of potential consistency issues
+    """
+    issues = []
+    
+    # Check for remaining Portuguese terms
+    # Lower-case once; each check is then a plain substring search, which
+    # outruns a single regex alternation over the same text
+    text_lower = text.lower()
+    # str.isascii() reads a flag the string already carries; ASCII text cannot
+    # contain the accented indicators, so those searches are skipped
+    indicators = PORTUGUESE_ASCII_INDICATORS if text.isascii() else PORTUGUESE_INDICATORS
+    for indicator in indicators:
+        if indicator in text_lower:
+            issues.append(f"Potential Portuguese text found: '{indicator}'")
+    
+    # Words ending in 'ção' can only be present when 'ção' itself is
+    if 'ção' in text_lower:
+        for word in PORTUGUESE_CAO_WORDS:
+            if word in text_lower:
+                issues.append(f"Potential Portuguese text found: '{word}'")
+    
+    return issues
+
 class TerminologyDictionary:
     """
     Comprehensive dictionary for technical term translations between Portuguese and English.
     Organized by domain for consistent translation across the scientific article.
+    
+    Instances share the module tables; one gets its own copies only once
+    add_term is called on it, and builds its lookup tables when next used.
     """
     
+    __slots__ = (
+        'terminology_map', 'abbreviations', 'units',
+        '_flat_map', '_domain_overrides', '_term_pattern'
+    )
+    
     def __init__(self):
-        self.terminology_map = {
-            'structural_engineering': {
-                # Steel and Materials
-                'aço ASTM A572 Grau 50': 'ASTM A572 Grade 50 steel',
-                'vigas W': 'W-beams',
-                'vigas de aço': 'steel beams',
-                'estruturas metálicas': 'metal structures',
-                'elementos estruturais': 'structural elements',
-                'integridade estrutural': 'structural integrity',
-                'segurança estrutural': 'structural safety',
-                'inspeção estrutural': 'structural inspection',
-                'monitoramento estrutural': 'structural monitoring',
-                'patologia estrutural': 'structural pathology',
-                
-                # Corrosion Terms
-                'corrosão': 'corrosion',
-                'corrosão atmosférica': 'atmospheric corrosion',
-                'corrosão uniforme': 'uniform corrosion',
-                'corrosão por pites': 'pitting corrosion',
-                'corrosão galvânica': 'galvanic corrosion',
-                'produtos de corrosão': 'corrosion products',
-                'processos corrosivos': 'corrosive processes',
-                'deterioração': 'deterioration',
-                'oxidação': 'oxidation',
-                'ferrugem': 'rust',
-                
-                # Inspection and Testing
-                'inspeção visual': 'visual inspection',
-                'ensaios não destrutivos': 'non-destructive testing',
-                'detecção automatizada': 'automated detection',
-                'monitoramento': 'monitoring',
-                'avaliação': 'assessment',
-                'diagnóstico': 'diagnosis',
-                
-                # Properties and Characteristics
-                'propriedades mecânicas': 'mechanical properties',
-                'tensão de escoamento': 'yield strength',
-                'tensão de ruptura': 'tensile strength',
-                'resistência': 'strength',
-                'ductilidade': 'ductility',
-                'soldabilidade': 'weldability',
-                'composição química': 'chemical composition',
-                'microestrutura': 'microstructure'
-            },
-            
-            'deep_learning': {
-                # Neural Networks
-                'redes neurais convolucionais': 'convolutional neural networks',
-                'redes neurais profundas': 'deep neural networks',
-                'aprendizado profundo': 'deep learning',
-                'inteligência artificial': 'artificial intelligence',
-                'visão computacional': 'computer vision',
-                'processamento de imagens': 'image processing',
-                
-                # Architectures
-                'U-Net': 'U-Net',
-                'Attention U-Net': 'Attention U-Net',
-                'arquitetura': 'architecture',
-                'encoder': 'encoder',
-                'decoder': 'decoder',
-                'bottleneck': 'bottleneck',
-                'skip connections': 'skip connections',
-                'attention gates': 'attention gates',
-                'mecanismos de atenção': 'attention mechanisms',
-                
-                # Training and Optimization
-                'treinamento': 'training',
-                'otimização': 'optimization',
-                'otimizador': 'optimizer',
-                'função de perda': 'loss function',
-                'taxa de aprendizado': 'learning rate',
-                'hiperparâmetros': 'hyperparameters',
-                'épocas': 'epochs',
-                'batch size': 'batch size',
-                'validação cruzada': 'cross-validation',
-                'early stopping': 'early stopping',
-                'overfitting': 'overfitting',
-                'regularização': 'regularization',
-                'dropout': 'dropout',
-                
-                # Data Processing
-                'pré-processamento': 'preprocessing',
-                'augmentação de dados': 'data augmentation',
-                'normalização': 'normalization',
-                'redimensionamento': 'resizing',
-                'dataset': 'dataset',
-                'conjunto de dados': 'dataset',
-                'anotação manual': 'manual annotation',
-                'máscaras binárias': 'binary masks',
-                'ground truth': 'ground truth'
-            },
-            
-            'segmentation_metrics': {
-                # Evaluation Metrics
-                'segmentação semântica': 'semantic segmentation',
-                'Intersection over Union': 'Intersection over Union (IoU)',
-                'IoU': 'IoU',
-                'Coeficiente Dice': 'Dice coefficient',
-                'Dice': 'Dice coefficient',
-                'precisão': 'precision',
-                'revocação': 'recall',
-                'recall': 'recall',
-                'F1-Score': 'F1-Score',
-                'acurácia': 'accuracy',
-                'especificidade': 'specificity',
-                'sensibilidade': 'sensitivity',
-                
-                # Statistical Terms
-                'verdadeiros positivos': 'true positives',
-                'falsos positivos': 'false positives',
-                'verdadeiros negativos': 'true negatives',
-                'falsos negativos': 'false negatives',
-                'matriz de confusão': 'confusion matrix',
-                'curva ROC': 'ROC curve',
-                'área sob a curva': 'area under the curve',
-                'AUC': 'AUC'
-            },
-            
-            'statistics': {
-                # Statistical Analysis
-                'análise estatística': 'statistical analysis',
-                'teste t de Student': "Student's t-test",
-                'teste de significância': 'significance test',
-                'intervalo de confiança': 'confidence interval',
-                'nível de significância': 'significance level',
-                'valor p': 'p-value',
-                'hipótese nula': 'null hypothesis',
-                'hipótese alternativa': 'alternative hypothesis',
-                'média': 'mean',
-                'desvio padrão': 'standard deviation',
-                'mediana': 'median',
-                'quartis': 'quartiles',
-                'distribuição normal': 'normal distribution',
-                'correlação': 'correlation',
-                'regressão': 'regression'
-            },
-            
-            'academic_writing': {
-                # Document Structure
-                'resumo': 'abstract',
-                'palavras-chave': 'keywords',
-                'introdução': 'introduction',
-                'revisão da literatura': 'literature review',
-                'metodologia': 'methodology',
-                'resultados': 'results',
-                'discussão': 'discussion',
-                'conclusões': 'conclusions',
-                'referências': 'references',
-                'bibliografia': 'bibliography',
-                
-                # Academic Terms
-                'objetivo geral': 'general objective',
-                'objetivos específicos': 'specific objectives',
-                'justificativa': 'rationale',
-                'relevância científica': 'scientific relevance',
-                'contribuição': 'contribution',
-                'limitações': 'limitations',
-                'trabalhos futuros': 'future work',
-                'estado da arte': 'state of the art',
-                'lacuna de conhecimento': 'knowledge gap',
-                
-                # Research Terms
-                'pesquisa': 'research',
-                'estudo': 'study',
-                'investigação': 'investigation',
-                'experimento': 'experiment',
-                'protocolo experimental': 'experimental protocol',
-                'procedimento': 'procedure',
-                'método': 'method',
-                'abordagem': 'approach',
-                'técnica': 'technique',
-                'ferramenta': 'tool'
-            },
-            
-            'figures_tables': {
-                # Figure References
-                'Figura': 'Figure',
-                'Tabela': 'Table',
-                'Gráfico': 'Graph',
-                'Diagrama': 'Diagram',
-                'Fluxograma': 'Flowchart',
-                'Esquema': 'Scheme',
-                
-                # Figure Descriptions
-                'arquitetura da rede': 'network architecture',
-                'fluxograma da metodologia': 'methodology flowchart',
-                'comparação de segmentações': 'segmentation comparison',
-                'gráficos de performance': 'performance graphs',
-                'curvas de aprendizado': 'learning curves',
-                'mapas de atenção': 'attention maps',
-                'características do dataset': 'dataset characteristics',
-                'configurações de treinamento': 'training configurations',
-                'resultados quantitativos': 'quantitative results',
-                'análise computacional': 'computational analysis'
-            }
-        }
-        
-        # Abbreviations and acronyms
-        self.abbreviations = {
-            'CNN': 'CNN',
-            'GPU': 'GPU',
-            'CPU': 'CPU',
-            'RAM': 'RAM',
-            'RGB': 'RGB',
-            'JPEG': 'JPEG',
-            'TIFF': 'TIFF',
-            'PDF': 'PDF',
-            'LaTeX': 'LaTeX',
-            'ASTM': 'ASTM',
-            'ISO': 'ISO',
-            'AISC': 'AISC',
-            'MPa': 'MPa',
-            'ksi': 'ksi',
-            'mm': 'mm',
-            'cm': 'cm',
-            'kg': 'kg',
-            'GPU': 'GPU',
-            'CUDA': 'CUDA',
-            'cuDNN': 'cuDNN'
-        }
+        self.terminology_map = TERMINOLOGY_MAP
+        self.abbreviations = ABBREVIATIONS
+        self.units = UNITS
+        # Lookup tables for this instance's own terms; None while the shared
+        # tables are in use or after add_term has invalidated them
+        self._flat_map = None
+        self._domain_overrides = None
+        self._term_pattern = None
+    
+    def _lookup_tables(self):
+        """Return (flat map, domain overrides, pattern), building them if needed."""
+        if self.terminology_map is TERMINOLOGY_MAP:
+            return _shared_lookup_tables()
         
-        # Units and measurements
-        self.units = {
-            'pixels': 'pixels',
-            'megapixels': 'megapixels',
-            'bits': 'bits',
-            'bytes': 'bytes',
-            'MB': 'MB',
-            'GB': 'GB',
-            'Hz': 'Hz',
-            'MHz': 'MHz',
-            'GHz': 'GHz',
-            'segundos': 'seconds',
-            'minutos': 'minutes',
-            'horas': 'hours',
-            'graus': 'degrees',
-            '°C': '°C',
-            '%': '%'
-        }
+        if self._flat_map is None:
+            self._flat_map, self._domain_overrides, self._term_pattern = _build_lookup_tables(
+                self.terminology_map, self.abbreviations, self.units
+            )
+        return self._flat_map, self._domain_overrides, self._term_pattern
     
     def get_translation(self, term, domain=None):
         """
@@ -262,27 +495,31 @@ class TerminologyDictionary:
         Returns:
             str: English translation or original term if not found
         """
-        term_lower = term.lower()
-        
-        if domain and domain in self.terminology_map:
-            if term_lower in self.terminology_map[domain]:
-                return self.terminology_map[domain][term_lower]
+        if self.terminology_map is TERMINOLOGY_MAP:
+            return get_translation(term, domain)
         
-        # Search across all domains if not found in specific domain
-        for domain_dict in self.terminology_map.values():
-            if term_lower in domain_dict:
-                return domain_dict[term_lower]
+        flat_map, domain_overrides, _ = self._lookup_tables()
+        term_lower = term.lower()
         
-        # Check abbreviations
-        if term in self.abbreviations:
-            return self.abbreviations[term]
+        if domain_overrides and domain is not None:
+            translation = domain_overrides.get((domain, term_lower))
+            if translation is not None:
+                return translation
         
-        # Check units
-        if term_lower in self.units:
-            return self.units[term_lower]
+        return flat_map.get(term_lower, term)
+    
+    def translate_text(self, text):
+        """
+        Translate every known term in a text in a single pass.
         
-        # Return original term if no translation found
-        return term
+        Args:
+            text (str): Portuguese text to translate
+            
+        Returns:
+            str: Text with every known term replaced by its English translation
+        """
+        flat_map, _, term_pattern = self._lookup_tables()
+        return term_pattern.sub(partial(_replace_term, flat_map), text)
     
     def get_all_terms_by_domain(self, domain):
         """
@@ -292,9 +529,14 @@ class TerminologyDictionary:
             domain (str): Domain name
             
         Returns:
-            dict: Dictionary of Portuguese-English term pairs
+            dict: Read-only mapping of Portuguese-English term pairs
         """
-        return self.terminology_map.get(domain, {})
+        if self.terminology_map is TERMINOLOGY_MAP:
+            return get_all_terms_by_domain(domain)
+        
+        # This instance's own tables: a read-only view that follows add_term
+        terms = self.terminology_map.get(domain)
+        return _EMPTY_TERMS if terms is None else MappingProxyType(terms)
     
     def add_term(self, portuguese_term, english_term, domain):
         """
@@ -305,10 +547,18 @@ class TerminologyDictionary:
             english_term (str): English translation
             domain (str): Domain category
         """
+        if self.terminology_map is TERMINOLOGY_MAP:
+            # First addition on this instance: copy the shared tables
+            self.terminology_map = {
+                name: dict(domain_dict) for name, domain_dict in TERMINOLOGY_MAP.items()
+            }
+        
         if domain not in self.terminology_map:
             self.terminology_map[domain] = {}
         
         self.terminology_map[domain][portuguese_term.lower()] = english_term
+        # Rebuilt on the next lookup, so a run of additions builds them once
+        self._flat_map = None
     
     def validate_consistency(self, text):
         """
@@ -320,16 +570,4 @@ class TerminologyDictionary:
         Returns:
             list: List of potential consistency issues
         """
-        issues = []
-        
-        # Check for remaining Portuguese terms
-        portuguese_indicators = [
-            'ção', 'são', 'ões', 'ção', 'mente', 'dade', 'agem',
-            'treinamento', 'aprendizado', 'segmentação', 'detecção'
-        ]
-        
-        for indicator in portuguese_indicators:
-            if indicator in text.lower():
-                issues.append(f"Potential Portuguese text found: '{indicator}'")
-        
-        return issues
\ No newline at end of file
+        return validate_consistency(text)
\ No newline at end of file
@@ -6,11 +6,37 @@ Automated checker for technical term consistency and translation quality.
 
 import re
 import os
+from functools import lru_cache
 from typing import Dict, List, Tuple, Set
 from dataclasses import dataclass
-from .terminology_dictionary import TerminologyDictionary
+from .terminology_dictionary import TerminologyDictionary, trie_pattern
 from .validation_config import ValidationConfig, default_config
 
+# Fixed document-structure patterns, compiled once at import
+METHODOLOGY_SECTION_RE = re.compile(r'\\section\{methodology\}.*?(?=\\section|\Z)', re.DOTALL | re.IGNORECASE)
+RESULTS_SECTION_RE = re.compile(r'\\section\{results\}.*?(?=\\section|\Z)', re.DOTALL | re.IGNORECASE)
+SECTION_RE = re.compile(r'\\section\{([^}]+)\}')
+FIGURE_RE = re.compile(r'\\begin\{figure\}')
+TABLE_RE = re.compile(r'\\begin\{table\}')
+CITE_RE = re.compile(r'\\cite\{[^}]+\}')
+EQUATION_RE = re.compile(r'\\begin\{equation\}')
+LATEX_COMMAND_WITH_ARG_RE = re.compile(r'\\[a-zA-Z]+\{[^}]*\}')
+LATEX_COMMAND_RE = re.compile(r'\\[a-zA-Z]+')
+LATEX_SYNTAX_RE = re.compile(r'[{}%]')
+WORD_RE = re.compile(r'\b\w+\b')
+
+
+@lru_cache(maxsize=8)
+def read_document(tex_file_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read and decode a LaTeX file, once per (path, mtime, size).
+    
+    The stat values are part of the cache key only, so an edited file is read
+    again while repeated validations of an unchanged one reuse the text.
+    """
+    with open(tex_file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 
 @dataclass
 class ValidationResult:
@@ -54,7 +80,7 @@ class TerminologyValidator:
                 r'\bestudo\b', r'\bpesquisa\b', r'\bmétodo\b',
                 r'\btécnica\b', r'\bferramenta\b', r'\bsistema\b',
                 r'\bmodelo\b', r'\barquitetura\b', r'\brede\b',
-                r'\btreinamento\b', r'\bvalidação\b', r'\bteste\b'
+                r'\bvalidação\b', r'\bteste\b'
             ],
             'articles_prepositions': [
                 r'\bda\b', r'\bdo\b', r'\bdas\b', r'\bdos\b',
@@ -64,6 +90,23 @@ class TerminologyValidator:
             ]
         }
         
+        # Literal Portuguese words are matched with one combined pattern per
+        # category, so the content is scanned once instead of once per word
+        self._portuguese_words = {
+            category: [pattern[2:-2] for pattern in self.portuguese_patterns[category]]
+            for category in ('common_words', 'articles_prepositions')
+        }
+        self._portuguese_word_scanners = {
+            category: re.compile(r'\b(?:' + '|'.join(words) + r')\b', re.IGNORECASE)
+            for category, words in self._portuguese_words.items()
+        }
+        # The endings share the \b\w*ENDING\b shape, so one pattern finds every
+        # word with any of them; the words are then sorted by ending
+        self._portuguese_endings = [pattern[5:-2] for pattern in self.portuguese_patterns['endings']]
+        self._ending_scanner = re.compile(
+            r'\b\w*(?:' + '|'.join(self._portuguese_endings) + r')\b', re.IGNORECASE
+        )
+        
         # Deep learning terminology validation
         self.deep_learning_terms = {
             'correct_english': {
@@ -80,7 +123,11 @@ class TerminologyValidator:
                 'neural network training': 'should be "training neural networks"',
                 'deep learning training': 'should be "training with deep learning"',
                 'segmentation training': 'should be "training for segmentation"'
-            }
+            },
+            'expected': (
+                'convolutional neural networks', 'deep learning', 'semantic segmentation',
+                'u-net', 'attention u-net', 'training', 'validation'
+            )
         }
         
         # Structural engineering terminology validation
@@ -101,7 +148,10 @@ class TerminologyValidator:
                 'aço': 'steel',
                 'corrosão': 'corrosion',
                 'inspeção': 'inspection'
-            }
+            },
+            'expected': (
+                'astm a572 grade 50', 'w-beams', 'corrosion', 'structural inspection'
+            )
         }
         
         # Academic writing patterns
@@ -119,6 +169,38 @@ class TerminologyValidator:
                 'median', 'significance level', 'null hypothesis', 'correlation'
             ]
         }
+        
+        # The pattern lists above are compiled once here rather than on every
+        # document or section the checks run over
+        self._passive_voice_scanners = [
+            re.compile(pattern) for pattern in self.academic_patterns['passive_voice_indicators']
+        ]
+        self._connector_scanners = [
+            re.compile(r'\b' + re.escape(connector) + r'\b')
+            for connector in self.academic_patterns['scientific_connectors']
+        ]
+        
+        # Term statistics: every whole-word occurrence of every term counts,
+        # including terms inside longer ones ('corrosion' in 'pitting
+        # corrosion'). One zero-width scan stops at each word start where a
+        # term begins and captures the longest one; the shorter terms it
+        # starts with are counted from the table built here
+        counted_terms = {
+            'deep_learning_terms': self.deep_learning_terms['correct_english'],
+            'structural_engineering_terms': self.structural_engineering_terms['correct_english'],
+        }
+        all_terms = set().union(*counted_terms.values())
+        self._term_count_scanner = re.compile(r'\b(?=(' + trie_pattern(all_terms) + r')\b)')
+        self._term_count_increments = {
+            longest: [
+                (statistic, sum(
+                    1 for term in terms
+                    if longest.startswith(term) and not re.match(r'\w', longest[len(term):len(term) + 1])
+                ))
+                for statistic, terms in counted_terms.items()
+            ]
+            for longest in all_terms
+        }
     
     def validate_document(self, tex_file_path: str) -> ValidationResult:
         """
@@ -131,8 +213,8 @@ class TerminologyValidator:
             ValidationResult: Comprehensive validation results
         """
         try:
-            with open(tex_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            stat = os.stat(tex_file_path)
+            content = read_document(tex_file_path, stat.st_mtime_ns, stat.st_size)
             
             issues = []
             warnings = []
@@ -180,32 +262,32 @@ class TerminologyValidator:
         """Check for remaining Portuguese text in the document."""
         issues = []
         
-        # Check for Portuguese word endings
-        for pattern in self.portuguese_patterns['endings']:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                unique_matches = set(matches)
-                for match in unique_matches:
+        # Check for Portuguese word endings; a word is reported once per
+        # ending it has ('eficiência' ends in both -ência and -ncia)
+        unique_matches = set(self._ending_scanner.findall(content))
+        for ending in self._portuguese_endings:
+            for match in unique_matches:
+                if match.lower().endswith(ending):
                     issues.append(f"Portuguese word ending detected: '{match}'")
         
         # Check for common Portuguese words
-        for pattern in self.portuguese_patterns['common_words']:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                unique_matches = set(matches)
-                for match in unique_matches:
-                    issues.append(f"Portuguese word detected: '{match}'")
+        for match in self._find_portuguese_words(content, 'common_words'):
+            issues.append(f"Portuguese word detected: '{match}'")
         
         # Check for Portuguese articles and prepositions
-        for pattern in self.portuguese_patterns['articles_prepositions']:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                unique_matches = set(matches)
-                for match in unique_matches:
-                    issues.append(f"Portuguese article/preposition detected: '{match}'")
+        for match in self._find_portuguese_words(content, 'articles_prepositions'):
+            issues.append(f"Portuguese article/preposition detected: '{match}'")
         
         return issues
     
+    def _find_portuguese_words(self, content: str, category: str) -> List[str]:
+        """Find literal Portuguese words of a category in a single scan, in word-list order."""
+        found = {}
+        for match in self._portuguese_word_scanners[category].finditer(content):
+            found.setdefault(match.group(0).lower(), set()).add(match.group(0))
+        
+        return [match for word in self._portuguese_words[category] for match in found.get(word, ())]
+    
     def _validate_deep_learning_terms(self, content: str) -> Tuple[List[str], List[str]]:
         """Validate proper usage of deep learning terminology."""
         issues = []
@@ -218,22 +300,17 @@ class TerminologyValidator:
             if incorrect in content_lower:
                 issues.append(f"Incorrect usage: '{incorrect}' - {correction}")
         
-        # Check for presence of key deep learning terms
-        expected_terms = [
-            'convolutional neural networks', 'deep learning', 'semantic segmentation',
-            'u-net', 'attention u-net', 'training', 'validation'
+        # Check for presence of key deep learning terms; a substring search per
+        # term (memchr-based, and the terms are few) beats any combined scan
+        missing_terms = [
+            term for term in self.deep_learning_terms['expected'] if term not in content_lower
         ]
         
-        missing_terms = []
-        for term in expected_terms:
-            if term not in content_lower:
-                missing_terms.append(term)
-        
         if missing_terms:
             warnings.append(f"Expected deep learning terms not found: {', '.join(missing_terms)}")
         
         # Check for consistent terminology usage
-        inconsistencies = self._check_term_consistency(content, 'deep_learning')
+        inconsistencies = self._check_term_consistency(content_lower, 'deep_learning')
         issues.extend(inconsistencies)
         
         return issues, warnings
@@ -251,35 +328,33 @@ class TerminologyValidator:
                 issues.append(f"Incorrect term: '{mistake}' should be '{correction}'")
         
         # Check for presence of key structural engineering terms
-        expected_terms = [
-            'astm a572 grade 50', 'w-beams', 'corrosion', 'structural inspection'
+        missing_terms = [
+            term for term in self.structural_engineering_terms['expected'] if term not in content_lower
         ]
         
-        missing_terms = []
-        for term in expected_terms:
-            if term not in content_lower:
-                missing_terms.append(term)
-        
         if missing_terms:
             warnings.append(f"Expected structural engineering terms not found: {', '.join(missing_terms)}")
         
         # Check for consistent terminology usage
-        inconsistencies = self._check_term_consistency(content, 'structural_engineering')
+        inconsistencies = self._check_term_consistency(content_lower, 'structural_engineering')
         issues.extend(inconsistencies)
         
         return issues, warnings
     
-    def _check_term_consistency(self, content: str, domain: str) -> List[str]:
-        """Check for consistent usage of terms within a domain."""
+    def _check_term_consistency(self, content_lower: str, domain: str) -> List[str]:
+        """Check for consistent usage of terms within a domain, given lower-cased content."""
         issues = []
         
         domain_terms = self.terminology_dict.get_all_terms_by_domain(domain)
-        content_lower = content.lower()
-        
-        # Track usage of different variations of the same concept
-        term_variations = {}
         
+        # The callers have already lower-cased the content. Each pair costs at
+        # most two substring searches, and the English one only runs when the
+        # Portuguese term is present
         for portuguese_term, english_term in domain_terms.items():
+            # Terms spelled the same in both languages (e.g. 'u-net') can't be mixed
+            if portuguese_term == english_term.lower():
+                continue
+            
             # Check if both Portuguese and English versions appear
             if portuguese_term in content_lower and english_term.lower() in content_lower:
                 issues.append(f"Inconsistent usage: both '{portuguese_term}' and '{english_term}' found")
@@ -293,13 +368,13 @@ class TerminologyValidator:
         content_lower = content.lower()
         
         # Check for passive voice in methodology section
-        methodology_match = re.search(r'\\section\{methodology\}.*?(?=\\section|\Z)', content, re.DOTALL | re.IGNORECASE)
+        methodology_match = METHODOLOGY_SECTION_RE.search(content)
         if methodology_match:
             methodology_text = methodology_match.group(0).lower()
             passive_voice_found = False
             
-            for pattern in self.academic_patterns['passive_voice_indicators']:
-                if re.search(pattern, methodology_text):
+            for scanner in self._passive_voice_scanners:
+                if scanner.search(methodology_text):
                     passive_voice_found = True
                     break
             
@@ -308,14 +383,14 @@ class TerminologyValidator:
         
         # Check for scientific connectors
         connector_count = 0
-        for connector in self.academic_patterns['scientific_connectors']:
-            connector_count += len(re.findall(r'\b' + re.escape(connector) + r'\b', content_lower))
+        for scanner in self._connector_scanners:
+            connector_count += len(scanner.findall(content_lower))
         
         if connector_count < 5:
             warnings.append("Consider using more scientific connectors for better flow")
         
         # Check for statistical terms in results section
-        results_match = re.search(r'\\section\{results\}.*?(?=\\section|\Z)', content, re.DOTALL | re.IGNORECASE)
+        results_match = RESULTS_SECTION_RE.search(content)
         if results_match:
             results_text = results_match.group(0).lower()
             statistical_terms_found = 0
@@ -334,43 +409,38 @@ class TerminologyValidator:
         statistics = {}
         
         # Count sections
-        sections = re.findall(r'\\section\{([^}]+)\}', content)
+        sections = SECTION_RE.findall(content)
         statistics['section_count'] = len(sections)
         
         # Count figures and tables
-        figures = re.findall(r'\\begin\{figure\}', content)
-        tables = re.findall(r'\\begin\{table\}', content)
+        figures = FIGURE_RE.findall(content)
+        tables = TABLE_RE.findall(content)
         statistics['figure_count'] = len(figures)
         statistics['table_count'] = len(tables)
         
         # Count citations
-        citations = re.findall(r'\\cite\{[^}]+\}', content)
+        citations = CITE_RE.findall(content)
         statistics['citation_count'] = len(citations)
         
         # Count mathematical equations
-        equations = re.findall(r'\\begin\{equation\}', content)
+        equations = EQUATION_RE.findall(content)
         statistics['equation_count'] = len(equations)
         
         # Count words (approximate)
         # Remove LaTeX commands and count remaining words
-        text_only = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', '', content)
-        text_only = re.sub(r'\\[a-zA-Z]+', '', text_only)
-        text_only = re.sub(r'[{}%]', '', text_only)
-        words = re.findall(r'\b\w+\b', text_only)
+        text_only = LATEX_COMMAND_WITH_ARG_RE.sub('', content)
+        text_only = LATEX_COMMAND_RE.sub('', text_only)
+        text_only = LATEX_SYNTAX_RE.sub('', text_only)
+        words = WORD_RE.findall(text_only)
         statistics['word_count'] = len(words)
         
-        # Count deep learning terms
-        dl_term_count = 0
+        # Count deep learning and structural engineering terms in one scan
+        statistics['deep_learning_terms'] = 0
+        statistics['structural_engineering_terms'] = 0
         content_lower = content.lower()
-        for term in self.deep_learning_terms['correct_english']:
-            dl_term_count += len(re.findall(r'\b' + re.escape(term) + r'\b', content_lower))
-        statistics['deep_learning_terms'] = dl_term_count
-        
-        # Count structural engineering terms
-        se_term_count = 0
-        for term in self.structural_engineering_terms['correct_english']:
-            se_term_count += len(re.findall(r'\b' + re.escape(term) + r'\b', content_lower))
-        statistics['structural_engineering_terms'] = se_term_count
+        for match in self._term_count_scanner.finditer(content_lower):
+            for statistic, count in self._term_count_increments[match.group(1)]:
+                statistics[statistic] += count
         
         return statistics
     
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the bibliography validator (run with: python -m unittest test_bibliography_validator)
+"""
+
+import os
+import tempfile
+import unittest
+
+from bibliography_validator import extract_bib_keys, extract_citations, validate_bibliography_format
+
+
+class EmptyFileTest(unittest.TestCase):
+    """Empty sources must give empty results, not mmap errors."""
+    
+    def write_file(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+    
+    def test_empty_bib_has_no_keys(self):
+        self.assertEqual(extract_bib_keys(self.write_file('.bib', b'')), set())
+    
+    def test_empty_tex_has_no_citations(self):
+        self.assertEqual(extract_citations(self.write_file('.tex', b'')), set())
+    
+    def test_empty_bib_has_no_format_issues(self):
+        self.assertEqual(validate_bibliography_format(self.write_file('.bib', b'')), [])
+    
+    def test_non_empty_files_still_scanned(self):
+        bib = self.write_file('.bib', b'@article{key1,\n  booktitle={X},\n  journal={Springer}\n}\n')
+        tex = self.write_file('.tex', b'\\cite{key1, key2}')
+        self.assertEqual(extract_bib_keys(bib), {'key1'})
+        self.assertEqual(extract_citations(tex), {'key1', 'key2'})
+        self.assertEqual(validate_bibliography_format(bib), [
+            "Line 1: @article entry has booktitle (should be @inproceedings)",
+            "Line 3: Publisher in journal field",
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the terminology validator (run from src with: python -m unittest translation.test_terminology_validator)
+"""
+
+import unittest
+
+from translation.terminology_validator import TerminologyValidator
+
+
+class TermConsistencyTest(unittest.TestCase):
+    """Only genuine Portuguese/English mixes count as inconsistent usage."""
+    
+    def setUp(self):
+        self.validator = TerminologyValidator()
+    
+    def test_identical_terms_are_not_inconsistent(self):
+        content_lower = 'the u-net and attention u-net encoder outperform the baseline.'
+        self.assertEqual(self.validator._check_term_consistency(content_lower, 'deep_learning'), [])
+    
+    def test_mixed_terms_are_inconsistent(self):
+        content_lower = 'aprendizado profundo (deep learning)'
+        self.assertEqual(
+            self.validator._check_term_consistency(content_lower, 'deep_learning'),
+            ["Inconsistent usage: both 'aprendizado profundo' and 'deep learning' found"]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
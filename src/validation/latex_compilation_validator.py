@@ -18,12 +18,25 @@ import os
 import subprocess
 import re
 import sys
+import functools
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import tempfile
 import shutil
 from datetime import datetime
 
+
+@functools.lru_cache(maxsize=4)
+def _load_tex(path: str, mtime_ns: int) -> str:
+    """Read and decode a LaTeX file; cached per path and modification time."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def load_tex(path) -> str:
+    """Return the content of a LaTeX file, sharing one decoded copy per process."""
+    return _load_tex(str(path), os.stat(path).st_mtime_ns)
+
+
 class LaTeXCompilationValidator:
     """Validates LaTeX compilation and formatting for English scientific article."""
     
@@ -117,8 +130,7 @@ class LaTeXCompilationValidator:
         
         try:
             # Read LaTeX content
-            with open(self.tex_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = load_tex(self.tex_file_path)
             
             # Check for equation environments
             equation_patterns = [
@@ -183,8 +195,7 @@ class LaTeXCompilationValidator:
         
         try:
             # Read LaTeX content
-            with open(self.tex_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = load_tex(self.tex_file_path)
             
             # Find figure labels
             figure_labels = re.findall(r'\\label\{fig:([^}]+)\}', content)
@@ -248,8 +259,7 @@ class LaTeXCompilationValidator:
         
         try:
             # Read LaTeX content
-            with open(self.tex_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = load_tex(self.tex_file_path)
             
             # Check English babel configuration
             english_babel_patterns = [
@@ -424,8 +434,7 @@ class LaTeXCompilationValidator:
     def _check_english_babel(self) -> bool:
         """Check if English babel package is loaded."""
         try:
-            with open(self.tex_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = load_tex(self.tex_file_path)
             return '[english]' in content and 'babel' in content
         except:
             return False